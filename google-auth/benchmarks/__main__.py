@@ -0,0 +1,78 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs the benchmark suite.
+
+Run from the ``google-auth`` directory:
+
+	python -m benchmarks [--output FILE] [--baseline FILE] [NAME ...]
+	micropython -m benchmarks [--output FILE] [--baseline FILE] [NAME ...]
+
+Names limit the run to cases whose name starts with one of them. ``--output`` saves the results as JSON, and
+``--baseline`` compares them with results saved by an earlier run.
+"""
+
+import sys
+
+from benchmarks.cases import make_cases
+from benchmarks.runner import implementation, measure, save_results, load_results
+
+
+
+def _parse_arguments (arguments: list[str]) -> tuple[str | None, str | None, list[str]]:
+	output: str | None = None
+	baseline: str | None = None
+	names: list[str] = []
+
+	arguments = list(arguments)
+	while arguments:
+		argument = arguments.pop(0)
+
+		if argument == '--output':
+			output = arguments.pop(0)
+		elif argument == '--baseline':
+			baseline = arguments.pop(0)
+		else:
+			names.append(argument)
+
+	return output, baseline, names
+
+
+
+def main () -> None:
+	output, baseline, names = _parse_arguments(sys.argv[1:])
+
+	baseline_results: dict[str, dict] = load_results(baseline) if baseline else {}
+	results: dict[str, dict] = {}
+
+	print(implementation())
+
+	for name, function, iterations in make_cases():
+		if names and not any(name.startswith(i) for i in names):
+			continue
+
+		result = results[name] = measure(function, iterations)
+		line = f"{name:24} {result['mean_us']:12.1f} us  {result['peak_bytes']:10} bytes"
+
+		if (previous := baseline_results.get(name)) is not None:
+			line += f"  {result['mean_us'] / previous['mean_us']:6.2f}x time  {result['peak_bytes'] - previous['peak_bytes']:+8} bytes"
+
+		print(line)
+
+	if output:
+		save_results(output, results)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,80 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the base64url codec with the per-byte translation it replaced, on the sizes a JWT uses.
+
+	python -m benchmarks.bench_base64
+	micropython -m benchmarks.bench_base64
+"""
+
+from binascii import a2b_base64, b2a_base64
+
+from google.auth.util import base64url
+
+from benchmarks.runner import now_us, elapsed_us
+
+
+ITERATIONS: int = 200
+
+# A header, a payload and an RSA-2048 signature.
+SIZES: tuple[int, ...] = (40, 240, 256)
+
+_ENCODE_TABLE: dict[int, int] = dict(zip(b'+/', b'-_'))
+_DECODE_TABLE: dict[int, int] = dict(zip(b'-_', b'+/'))
+
+
+
+def _translate (value: bytes, table: dict[int, int]) -> bytes:
+	result = bytearray()
+
+	for byte in value:
+		result.append(table.get(byte, byte))
+
+	return bytes(result)
+
+
+
+def reference_encode (value: bytes) -> bytes:
+	return _translate(b2a_base64(value).rstrip(b'\n'), _ENCODE_TABLE).rstrip(b'=')
+
+
+
+def reference_decode (value: bytes) -> bytes:
+	return a2b_base64(_translate(value + b'=' * (-len(value) % 4), _DECODE_TABLE))
+
+
+
+def _time_us (function, value) -> float:
+	start = now_us()
+	for _ in range(ITERATIONS):
+		function(value)
+
+	return (elapsed_us(start)) / ITERATIONS
+
+
+
+def main () -> None:
+	for size in SIZES:
+		value = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+		encoded = base64url.encode(value)
+
+		if encoded != reference_encode(value) or base64url.decode(encoded) != value or reference_decode(encoded) != value:
+			raise SystemExit(f"base64url disagrees with the reference for {size} bytes")
+
+		print(f'encode {size:4} bytes  reference {_time_us(reference_encode, value):8.1f} us  base64url {_time_us(base64url.encode, value):8.1f} us')
+		print(f'decode {size:4} bytes  reference {_time_us(reference_decode, encoded):8.1f} us  base64url {_time_us(base64url.decode, encoded):8.1f} us')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,85 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reports what importing each of the package's entry points costs in a fresh interpreter.
+
+Reports the import time, the peak heap used while importing and how many modules were loaded.
+
+	python -m benchmarks.bench_imports [MODULE ...]
+	micropython -m benchmarks.bench_imports [MODULE ...]
+"""
+
+import os
+import sys
+
+from benchmarks.runner import now_us, elapsed_us, peak_bytes
+
+
+ENTRY_POINTS: tuple[str, ...] = (
+	'google.oauth2.service_account',
+	'google.auth.credentials.base',
+	'google.auth.jwt',
+	'google.auth.verification',
+	'google.oauth2.client',
+	'google.auth.transport.requests',
+	'google.auth.transport.session',
+)
+
+
+
+def report (name: str) -> None:
+	"""Imports ``name`` and prints its cost. Only meaningful in an interpreter that hasn't imported it yet."""
+
+	before = set(sys.modules)
+
+	start = now_us()
+	try:
+		__import__(name)
+
+	except ImportError as error:
+		print(f'{name:36} not importable: {error}')
+		return
+
+	elapsed = elapsed_us(start)
+
+	loaded = [module for module in sys.modules if module not in before]
+
+	# Forget everything the import loaded, so it can be repeated to measure the heap.
+	for module in loaded:
+		del sys.modules[module]
+
+	peak = peak_bytes(lambda: __import__(name))
+
+	print(f'{name:36} {elapsed:10} us  {peak:8} peak bytes  {len(loaded):4} modules')
+
+
+
+def main () -> None:
+	if len(sys.argv) > 1:
+		# The runner's clock comes from the package, so start from none of it loaded. The runner keeps its functions.
+		for module in [module for module in sys.modules if module == 'google' or module.startswith('google.')]:
+			del sys.modules[module]
+
+		for name in sys.argv[1:]:
+			report(name)
+
+		return
+
+	# One interpreter per entry point, so none benefits from another's imports.
+	for name in ENTRY_POINTS:
+		os.system(f'{sys.executable} -m benchmarks.bench_imports {name}')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,71 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares loading a signer from the JSON service account file and from its binary conversion.
+
+Reports the time and peak memory per load.
+
+	python -m benchmarks.bench_key_file
+	micropython -m benchmarks.bench_key_file
+"""
+
+from json import load as load_json
+import os
+
+from google.auth.crypt.rsa import RSASigner
+from google.oauth2 import service_account_binary
+
+from benchmarks.runner import SERVICE_ACCOUNT_FILE, load_service_account_info, now_us, elapsed_us, peak_bytes
+
+
+ITERATIONS: int = 20
+BINARY_FILE: str = 'benchmarks/service_account.bin'
+
+
+
+def from_json () -> RSASigner:
+	with open(SERVICE_ACCOUNT_FILE) as json_file:
+		return RSASigner.from_service_account_info(load_json(json_file))
+
+
+
+def from_binary () -> RSASigner:
+	return RSASigner.from_service_account_info(service_account_binary.load(BINARY_FILE))
+
+
+
+def _time_us (function) -> float:
+	start = now_us()
+	for _ in range(ITERATIONS):
+		function()
+
+	return (elapsed_us(start)) / ITERATIONS
+
+
+
+def main () -> None:
+	with open(BINARY_FILE, 'wb') as binary_file:
+		binary_file.write(service_account_binary.encode(load_service_account_info()))
+
+	if from_binary().sign(b'message') != from_json().sign(b'message'):
+		raise SystemExit("The binary key file signs differently")
+
+	for name, function in (('json', from_json), ('binary', from_binary)):
+		print(f'{name:10} {_time_us(function):10.1f} us  {peak_bytes(function):8} peak bytes')
+
+	os.remove(BINARY_FILE)
+
+
+if __name__ == '__main__':
+	main()
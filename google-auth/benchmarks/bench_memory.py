@@ -0,0 +1,60 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Checks that a full refresh, signed by the pure-Python signer that boards use, stays under a peak heap ceiling.
+
+	python -m benchmarks.bench_memory [--ceiling BYTES]
+	micropython -m benchmarks.bench_memory --ceiling BYTES
+
+Exits with an error if the ceiling is exceeded. MicroPython reports everything allocated during the refresh rather
+than the peak, so its ceiling has to be given for the board in question.
+"""
+
+import sys
+
+from google.auth.crypt.rsa import RSASigner
+from google.oauth2.service_account import Credentials
+
+from benchmarks import fake_transport
+from benchmarks.runner import implementation, load_service_account_info, peak_bytes
+
+
+# By ``sys.implementation.name``.
+CEILING_BYTES: dict[str, int] = {'cpython': 8 * 1024}
+
+
+
+def main () -> None:
+	ceiling = CEILING_BYTES.get(sys.implementation.name)
+	if '--ceiling' in sys.argv:
+		ceiling = int(sys.argv[sys.argv.index('--ceiling') + 1])
+
+	info = load_service_account_info()
+
+	# Not sharing tokens, so the refresh signs an assertion and calls the token endpoint.
+	credentials = Credentials(service_account_email = info['client_email'], token_uri = info['token_uri'], scopes = ['https://www.googleapis.com/auth/cloud-platform'], signer = RSASigner.from_service_account_info(info), token_cache = None)
+	request = fake_transport.Request()
+
+	# Warm up, so lazily imported modules and cached templates aren't counted.
+	credentials.refresh(request)
+
+	peak = peak_bytes(lambda: credentials.refresh(request))
+	print(f'{implementation()}: refresh peak {peak} bytes, ceiling {ceiling}')
+
+	if ceiling is not None and peak > ceiling:
+		raise SystemExit(f"Refreshing used {peak} bytes, over the {ceiling} byte ceiling")
+
+
+if __name__ == '__main__':
+	main()
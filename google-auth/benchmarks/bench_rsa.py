@@ -0,0 +1,71 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares CRT signing in ``RSASigner`` with ``rsa.pkcs1.sign``.
+
+Needs the ``rsa`` package, which the library itself no longer depends on.
+
+Run from the ``google-auth`` directory on CPython or the MicroPython unix port:
+
+	python -m benchmarks.bench_rsa
+	micropython -m benchmarks.bench_rsa
+"""
+
+try:
+	from rsa import pkcs1
+	from rsa.key import PrivateKey
+
+except ImportError:
+	raise SystemExit("bench_rsa compares against the rsa package, which is not installed.")
+
+from google.auth.crypt.rsa import RSASigner
+
+from benchmarks.runner import now_us, elapsed_us, load_service_account_info
+
+
+ITERATIONS: int = 10
+MESSAGE: bytes = b'eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9.eyJpc3MiOiJiZW5jaG1hcmsifQ'
+
+
+
+def _time_us (function, *args) -> float:
+	start = now_us()
+	for _ in range(ITERATIONS):
+		function(*args)
+
+	return (elapsed_us(start)) / ITERATIONS
+
+
+
+def main () -> None:
+	info = load_service_account_info()
+
+	components: dict[str, int] = info[RSASigner.SERVICE_ACCOUNT_INFO_PRIVATE_KEY]
+
+	signer = RSASigner.from_service_account_info(info)
+	reference_key = PrivateKey(**{i: components[i] for i in RSASigner.PRIVATE_KEY_COMPONENTS})
+
+	if signer.sign(MESSAGE) != pkcs1.sign(MESSAGE, reference_key, 'SHA-256'):
+		raise SystemExit("CRT signature does not match rsa.pkcs1.sign")
+
+	crt_us = _time_us(signer.sign, MESSAGE)
+	reference_us = _time_us(pkcs1.sign, MESSAGE, reference_key, 'SHA-256')
+
+	print(f'rsa.pkcs1.sign    {reference_us / 1000:10.2f} ms')
+	print(f'RSASigner.sign    {crt_us / 1000:10.2f} ms')
+	print(f'speedup           {reference_us / crt_us:10.2f}x')
+
+
+if __name__ == '__main__':
+	main()
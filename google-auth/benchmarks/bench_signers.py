@@ -0,0 +1,63 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cross-checks and measures the throughput of every signer backend available on this interpreter.
+
+	python -m benchmarks.bench_signers
+"""
+
+import time
+
+from google.auth.crypt.rsa import RSASigner
+from google.auth.crypt.factory import signer_class
+
+from benchmarks.runner import load_service_account_info
+
+
+DURATION_SECONDS: float = 2.0
+MESSAGE: bytes = b'eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9.eyJpc3MiOiJiZW5jaG1hcmsifQ'
+
+
+
+def _signatures_per_second (signer: RSASigner) -> float:
+	count = 0
+	start = time.time()
+	while (elapsed := time.time() - start) < DURATION_SECONDS:
+		signer.sign(MESSAGE)
+		count += 1
+
+	return count / elapsed
+
+
+
+def main () -> None:
+	info = load_service_account_info()
+
+	backends: list[type[RSASigner]] = [RSASigner]
+	if signer_class() is not RSASigner:
+		backends.append(signer_class())
+
+	signers = [backend.from_service_account_info(info) for backend in backends]
+
+	expected = signers[0].sign(MESSAGE)
+	for signer in signers[1:]:
+		if signer.sign(MESSAGE) != expected:
+			raise SystemExit(f"{type(signer).__name__} signature does not match RSASigner")
+
+	for signer in signers:
+		print(f'{type(signer).__name__:24} {_signatures_per_second(signer):10.1f} signatures/s')
+
+
+if __name__ == '__main__':
+	main()
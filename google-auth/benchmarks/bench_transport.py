@@ -0,0 +1,118 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares a refresh storm through the one-shot and pooled Requests transports. CPython only.
+
+Each transport POSTs an invalid grant, which is rejected without needing real credentials, so the timings are
+dominated by connection setup and the round-trip. With no URL, or ``-``, the requests go to a token endpoint stand-in
+started on the loopback interface. That has no TLS handshake to save, so pass a URL for the full picture, preferably
+one that isn't a production service.
+
+	python -m benchmarks.bench_transport [URL] [REQUESTS] [THREADS]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+import sys
+import time
+
+from google.auth.transport.base import BaseRequest
+from google.auth.transport.requests import Request as OneShotRequest
+from google.auth.transport.session import Request as PooledRequest
+
+
+DEFAULT_REQUESTS: int = 20
+DEFAULT_THREADS: int = 4
+
+BODY: bytes = b'grant_type=urn%3Aietf%3Aparams%3Aoauth%3Agrant-type%3Ajwt-bearer&assertion=invalid'
+HEADERS: dict[str, str] = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+ERROR_BODY: bytes = b'{"error": "invalid_grant", "error_description": "Invalid JWT Signature."}'
+
+
+
+class _TokenEndpoint(BaseHTTPRequestHandler):
+	"""Rejects every grant, like the real token endpoint does an invalid one, keeping the connection open."""
+
+	protocol_version = 'HTTP/1.1'
+
+	# The headers and body go out in separate writes, which Nagle's algorithm would hold up on a kept-alive connection.
+	disable_nagle_algorithm = True
+
+
+	def do_POST (self) -> None:
+		self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+		self.send_response(400)
+		self.send_header('Content-Type', 'application/json')
+		self.send_header('Content-Length', str(len(ERROR_BODY)))
+		self.end_headers()
+		self.wfile.write(ERROR_BODY)
+
+
+	def log_message (self, *args) -> None:
+		pass
+
+
+
+def _start_token_endpoint () -> tuple[ThreadingHTTPServer, str]:
+	server = ThreadingHTTPServer(('127.0.0.1', 0), _TokenEndpoint)
+	server.daemon_threads = True
+	Thread(target = server.serve_forever, daemon = True).start()
+
+	return server, f'http://127.0.0.1:{server.server_address[1]}/token'
+
+
+
+def _storm (request: BaseRequest, url: str, requests: int, threads: int) -> float:
+	start = time.perf_counter()
+
+	with ThreadPoolExecutor(threads) as executor:
+		for _ in executor.map(lambda _: request(url, 'POST', BODY, HEADERS), range(requests)):
+			pass
+
+	return time.perf_counter() - start
+
+
+
+def main () -> None:
+	url = sys.argv[1] if len(sys.argv) > 1 else '-'
+	requests = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_REQUESTS
+	threads = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_THREADS
+
+	server = None
+	if url == '-':
+		server, url = _start_token_endpoint()
+
+	try:
+		one_shot = _storm(OneShotRequest(), url, requests, threads)
+
+		pooled_request = PooledRequest(pool_size = threads)
+		pooled = _storm(pooled_request, url, requests, threads)
+		pooled_request.close()
+
+	finally:
+		if server is not None:
+			server.shutdown()
+			server.server_close()
+
+	print(f'{requests} requests over {threads} threads to {url}')
+	print(f'one-shot          {one_shot * 1000 / requests:10.2f} ms/request')
+	print(f'pooled            {pooled * 1000 / requests:10.2f} ms/request')
+	print(f'saved             {(one_shot - pooled) * 1000 / requests:10.2f} ms/request')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,88 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares encoding a JWT grant body with the generator-based urlencode it replaced, and with the prebuilt body.
+
+Reports the time and peak memory per body.
+
+	python -m benchmarks.bench_urlencode
+	micropython -m benchmarks.bench_urlencode
+"""
+
+from google.auth.util.urlencode import urlencode
+from google.oauth2.client import JWT_GRANT_TYPE, _jwt_grant_request
+
+from benchmarks.runner import now_us, elapsed_us, peak_bytes
+
+
+ITERATIONS: int = 200
+
+# About the size of a real assertion.
+ASSERTION: bytes = b'eyJ0eXAiOiAiSldUIiwgImFsZyI6ICJSUzI1NiJ9.' + b'eyJpYXQiOiAxNzAwMDAwMDAwfQ' * 14 + b'.' + b'c2lnbmF0dXJl' * 28
+
+_ALWAYS_SAFE: bytes = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-'
+
+
+
+def _reference_encode_bytes (string: bytes, safe: bytes):
+	for char in string:
+		if char in safe:
+			yield chr(char)
+		else:
+			yield f'%{char:02X}'
+
+
+
+def _reference_quote (string: str | bytes) -> str:
+	if isinstance(string, str):
+		string = string.encode('utf-8')
+
+	return (''.join(_reference_encode_bytes(string, b' ' + _ALWAYS_SAFE))).replace(' ', '+')
+
+
+
+def reference_body (assertion: bytes) -> bytes:
+	return '&'.join(f'{_reference_quote(k)}={_reference_quote(v)}' for k, v in {'assertion': assertion, 'grant_type': JWT_GRANT_TYPE}.items()).encode('utf-8')
+
+
+
+def urlencode_body (assertion: bytes) -> bytes:
+	return urlencode({'assertion': assertion, 'grant_type': JWT_GRANT_TYPE}).encode('utf-8')
+
+
+
+def prebuilt_body (assertion: bytes) -> bytes:
+	return _jwt_grant_request(assertion)[0]
+
+
+
+def _time_us (function) -> float:
+	start = now_us()
+	for _ in range(ITERATIONS):
+		function(ASSERTION)
+
+	return (elapsed_us(start)) / ITERATIONS
+
+
+
+def main () -> None:
+	if urlencode_body(ASSERTION) != reference_body(ASSERTION):
+		raise SystemExit("urlencode disagrees with the reference")
+
+	for name, function in (('reference', reference_body), ('urlencode', urlencode_body), ('prebuilt', prebuilt_body)):
+		print(f'{name:10} {_time_us(function):10.1f} us  {peak_bytes(lambda: function(ASSERTION)):8} peak bytes')
+
+
+if __name__ == '__main__':
+	main()
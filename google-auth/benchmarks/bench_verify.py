@@ -0,0 +1,90 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reports how many RS256 tokens per second ``google.auth.verification`` verifies.
+
+The public keys come from an in-process stand-in for the JWKS endpoint, serving the benchmark service account's key.
+
+	python -m benchmarks.bench_verify
+	micropython -m benchmarks.bench_verify
+"""
+
+from json import dumps as dump_json_string
+
+from google.auth.crypt.rsa import RSASigner
+from google.auth.jwt import JWTTemplate
+from google.auth.util.helpers import unpadded_urlsafe_b64encode, utcnow
+from google.auth.verification import KeySet, verify_token
+
+from benchmarks.fake_transport import Response
+from benchmarks.runner import implementation, load_service_account_info, now_us, elapsed_us, peak_bytes
+
+
+ITERATIONS: int = 200
+AUDIENCE: str = 'https://example.com/'
+
+
+
+def _encode_integer (value: int) -> str:
+	return unpadded_urlsafe_b64encode(value.to_bytes((len(hex(value)) - 1) // 2, 'big')).decode('ascii')
+
+
+
+class Request:
+	"""Serves a JWKS document holding one key, cacheable for an hour."""
+
+	calls: int
+	_content: bytes
+
+
+	def __init__ (self, key_id: str, n: int, e: int):
+		self.calls = 0
+		self._content = dump_json_string({'keys': [{'kty': 'RSA', 'alg': 'RS256', 'use': 'sig', 'kid': key_id, 'n': _encode_integer(n), 'e': _encode_integer(e)}]}).encode('utf-8')
+
+
+	def __call__ (self, url: str, method: str = 'GET', body: str | bytes | None = None, headers: dict[str, str] | None = None, timeout: int | None = None, **kwargs) -> Response:
+		self.calls += 1
+		return Response(200, self._content, {'Cache-Control': 'public, max-age=3600, must-revalidate, no-transform'})
+
+
+
+def main () -> None:
+	info = load_service_account_info()
+	signer = RSASigner.from_service_account_info(info)
+
+	components = info['private_key_components']
+	request = Request(signer.key_id, components['n'], components['e'])
+	key_set = KeySet('https://keys.invalid/certs')
+
+	issued_at = int(utcnow().timestamp())
+	token = JWTTemplate(signer, {'iss': info['client_email'], 'aud': AUDIENCE}).encode(issued_at, issued_at + 3600)
+
+	start = now_us()
+	verify_token(token, request, key_set, AUDIENCE)
+	first_us = elapsed_us(start)
+
+	start = now_us()
+	for _ in range(ITERATIONS):
+		verify_token(token, request, key_set, AUDIENCE)
+	cached_us = elapsed_us(start)
+
+	peak = peak_bytes(lambda: verify_token(token, request, key_set, AUDIENCE))
+
+	print(implementation())
+	print(f'first verification, fetching keys {first_us:10} us')
+	print(f'cached keys {ITERATIONS * 1_000_000 / cached_us:10.1f} verifications/s  {cached_us / ITERATIONS:8.1f} us each  {peak:8} peak bytes  {request.calls} fetches')
+
+
+if __name__ == '__main__':
+	main()
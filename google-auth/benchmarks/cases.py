@@ -0,0 +1,65 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The operations on the refresh path that the benchmark suite times."""
+
+from google.auth.crypt.rsa import RSASigner, RSAVerifier
+from google.auth.jwt import encode as encode_jwt
+from google.auth.util.exponential_backoff import ExponentialBackoff
+from google.auth.util.helpers import unpadded_urlsafe_b64encode
+from google.auth.util.urlencode import urlencode
+from google.oauth2.client import JWT_GRANT_TYPE
+from google.oauth2.service_account import Credentials
+
+from benchmarks import fake_transport
+from benchmarks.runner import load_service_account_info
+
+
+MESSAGE: bytes = b'eyJ0eXAiOiAiSldUIiwgImFsZyI6ICJSUzI1NiJ9.eyJpYXQiOiAxNzAwMDAwMDAwfQ'
+SIGNATURE: bytes = bytes(range(256))
+
+
+
+def make_cases () -> list[tuple[str, object, int]]:
+	"""Returns ``(name, function, iterations)`` for every case. Slow cases get fewer iterations."""
+
+	info = load_service_account_info()
+	signer = RSASigner.from_service_account_info(info)
+	verifier = RSAVerifier(info['private_key_components']['n'], info['private_key_components']['e'])
+	signature = signer.sign(MESSAGE)
+
+	payload = {'iat': 1700000000, 'exp': 1700003600, 'iss': info['client_email'], 'aud': Credentials.GOOGLE_OAUTH2_TOKEN_ENDPOINT, 'scope': 'https://www.googleapis.com/auth/cloud-platform'}
+	body = {'assertion': MESSAGE * 8, 'grant_type': JWT_GRANT_TYPE}
+
+
+	def backoff () -> None:
+		# No waiting, so only the iterator's own overhead is measured.
+		for _ in ExponentialBackoff(total_attempts = 3, initial_wait_seconds = 0):
+			pass
+
+
+	# Not sharing tokens, so every refresh signs an assertion and calls the token endpoint.
+	credentials = Credentials.from_service_account_info(info, scopes = ['https://www.googleapis.com/auth/cloud-platform'], token_cache = None)
+	request = fake_transport.Request()
+
+
+	return [
+		('rsa.sign', lambda: signer.sign(MESSAGE), 10),
+		('rsa.verify', lambda: verifier.verify(MESSAGE, signature), 100),
+		('jwt.encode', lambda: encode_jwt(signer, dict(payload)), 10),
+		('base64url.encode', lambda: unpadded_urlsafe_b64encode(SIGNATURE), 1000),
+		('urlencode', lambda: urlencode(body), 200),
+		('backoff', backoff, 1000),
+		('credentials.refresh', lambda: credentials.refresh(request), 10),
+	]
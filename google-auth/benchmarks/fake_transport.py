@@ -0,0 +1,65 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-process stand-in for the token endpoint, so refreshes can be timed without a network."""
+
+from google.auth.transport.base import BaseRequest, BaseResponse
+
+
+
+class Response(BaseResponse):
+	__slots__ = ('_status_code', '_headers', '_content')
+
+	_status_code: int
+	_headers: dict
+	_content: bytes
+
+
+	def __init__ (self, status_code: int, content: bytes, headers: dict | None = None):
+		self._status_code = status_code
+		self._content = content
+		self._headers = headers or {}
+
+
+	@property
+	def status_code (self) -> int:
+		return self._status_code
+
+
+	@property
+	def headers (self) -> dict:
+		return self._headers
+
+
+	@property
+	def content (self) -> bytes:
+		return self._content
+
+
+
+class Request(BaseRequest):
+	"""Answers every call with a successful token response."""
+
+	TOKEN_RESPONSE: bytes = b'{"access_token": "ya29.benchmark", "expires_in": 3599, "token_type": "Bearer"}'
+
+	calls: int
+
+
+	def __init__ (self):
+		self.calls = 0
+
+
+	def __call__ (self, url: str, method: str = 'GET', body: str | bytes | None = None, headers: dict[str, str] | None = None, timeout: int | None = None, **kwargs) -> Response:
+		self.calls += 1
+		return Response(200, self.TOKEN_RESPONSE)
@@ -0,0 +1,112 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Timing, memory measurement and result storage shared by the benchmarks.
+
+Everything here runs on CPython and the MicroPython unix port alike.
+"""
+
+from json import load as load_json, dump as dump_json
+import gc
+import sys
+
+from google.auth.util.ticks import ticks_us, ticks_diff
+
+
+SERVICE_ACCOUNT_FILE: str = 'benchmarks/service_account.json'
+
+
+
+def now_us () -> int:
+	"""A ``ticks_us`` reading, only meaningful to ``elapsed_us``."""
+
+	return ticks_us()
+
+
+
+def elapsed_us (start: int) -> int:
+	"""Microseconds since ``now_us`` returned ``start``. MicroPython's ticks wrap, so they can't just be subtracted."""
+
+	return ticks_diff(ticks_us(), start)
+
+
+
+def load_service_account_info () -> dict:
+	"""Loads the throwaway service account used by every benchmark."""
+
+	with open(SERVICE_ACCOUNT_FILE) as json_file:
+		return load_json(json_file)
+
+
+
+def implementation () -> str:
+	return f"{sys.implementation.name} {'.'.join(map(str, sys.implementation.version[:3]))}"
+
+
+
+def peak_bytes (function) -> int:
+	"""The most memory a single call holds at once."""
+
+	gc.collect()
+
+	if hasattr(gc, 'mem_alloc'):
+		# MicroPython. With collection off, growth of the heap is the call's peak.
+		gc.disable()
+		before = gc.mem_alloc()
+		function()
+		peak = gc.mem_alloc() - before
+		gc.enable()
+
+		return peak
+
+	import tracemalloc
+
+	tracemalloc.start()
+	function()
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+
+	return peak
+
+
+
+def measure (function, iterations: int) -> dict[str, float | int]:
+	"""Times ``function`` over ``iterations`` calls, after one warm-up call, and measures its peak memory."""
+
+	function()
+
+	timings: list[int] = []
+	for _ in range(iterations):
+		start = now_us()
+		function()
+		timings.append(elapsed_us(start))
+
+	return {
+		'iterations': iterations,
+		'mean_us': sum(timings) / iterations,
+		'min_us': min(timings),
+		'peak_bytes': peak_bytes(function),
+	}
+
+
+
+def save_results (filename: str, results: dict[str, dict]) -> None:
+	with open(filename, 'w') as json_file:
+		dump_json({'implementation': implementation(), 'results': results}, json_file)
+
+
+
+def load_results (filename: str) -> dict[str, dict]:
+	with open(filename) as json_file:
+		return load_json(json_file)['results']
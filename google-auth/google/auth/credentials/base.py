@@ -15,19 +15,49 @@
 """Interfaces for credentials."""
 
 from datetime import datetime, timedelta, timezone
+from time import time
 
-from google.oauth2.client import jwt_grant
-
-from google.auth.transport.base import BaseRequest
+from google.auth.transport.base import BaseRequest, AsyncBaseRequest
 from google.auth.crypt.base import BaseSigner
+from google.auth.credentials.cache import TokenCache, DEFAULT_TOKEN_CACHE
+from google.auth.util.single_flight import SingleFlight, AsyncSingleFlight
+from google.auth.util.ticks import ticks_ms, ticks_add, ticks_diff
+from google.auth import instrumentation
+
+# The token endpoint client, token store, refresh worker and backoff are only imported once they're needed, since a
+# process holding a valid token may never use them.
+
+
+# Refreshes that are in flight, by ``BaseCredentials._flight_key``.
+_REFRESH_FLIGHTS: SingleFlight = SingleFlight()
+_ASYNC_REFRESH_FLIGHTS: AsyncSingleFlight = AsyncSingleFlight()
 
 
 
 class BaseCredentials:
+	__slots__ = ('token', '_expiry', '_stale_at', '_expires_at', '_lifetime_ms', '_wall_expires_at', '_token_uri', '_scopes', '_default_scopes', '_signer', '_token_cache', '_token_store', '_refresh_worker', '_authorization')
+
 	REFRESH_THRESHOLD: timedelta = timedelta(minutes = 3, seconds = 45)
 
+	# MicroPython's tick counter wraps every 12 days, so deadlines are kept well within half of that. Tokens lasting
+	# longer are treated as expiring at this point, and refreshed early.
+	MAX_LIFETIME_MS: int = 5 * 24 * 60 * 60 * 1000
+
 	token: str | None
-	expiry: datetime | None
+
+	_expiry: datetime | None
+
+	# Deadlines in ``ticks_ms``, worked out whenever ``expiry`` is set, so checking the token's state allocates nothing.
+	_stale_at: int
+	_expires_at: int | None
+
+	# From setting ``expiry`` to ``_expires_at``. A longer wait until the deadline means the tick counter has wrapped,
+	# but only within one period of it: after a whole period the deadline reads as ahead again.
+	_lifetime_ms: int
+
+	# The expiry by ``time.time()``, which doesn't wrap. Tokens are only usable while both clocks agree, so a counter
+	# that has wrapped a whole period, say over a long light sleep, can't revive an expired token.
+	_wall_expires_at: int
 
 	_token_uri: str | None
 
@@ -36,6 +66,15 @@ class BaseCredentials:
 
 	_signer: BaseSigner
 
+	_token_cache: TokenCache | None
+	_token_store: 'FileTokenStore | None'
+
+	# Only set when stale tokens are refreshed in the background.
+	_refresh_worker: 'RefreshWorker | None'
+
+	# The last token applied and its header, as one tuple so threads never see a header for the wrong token.
+	_authorization: tuple[str, str] | None
+
 
 
 	class TokenState:
@@ -45,7 +84,7 @@ class BaseCredentials:
 
 
 
-	def __init__ (self, *, token: str | None = None, expiry: datetime | None = None, token_uri: str | None = None, scopes: list[str] | None = None, default_scopes: list[str] | None = None, signer: BaseSigner):
+	def __init__ (self, *, token: str | None = None, expiry: datetime | None = None, token_uri: str | None = None, scopes: list[str] | None = None, default_scopes: list[str] | None = None, signer: BaseSigner, token_cache: TokenCache | None = DEFAULT_TOKEN_CACHE, token_store: 'FileTokenStore | None' = None, non_blocking_refresh: bool = False):
 		self.token = token
 		self.expiry = expiry
 
@@ -61,10 +100,47 @@ class BaseCredentials:
 
 		self._signer = signer
 
+		# Pass ``token_cache = None`` to stop these credentials sharing tokens.
+		self._token_cache = token_cache
+
+		self._token_store = token_store
+
+		self._refresh_worker = None
+		if non_blocking_refresh:
+			from google.auth.credentials.refresh_worker import RefreshWorker
+			self._refresh_worker = RefreshWorker()
+
+		self._authorization = None
+
+
+	@property
+	def expiry (self) -> datetime | None:
+		return self._expiry
+
+
+	@expiry.setter
+	def expiry (self, expiry: datetime | None) -> None:
+		self._expiry = expiry
+
+		if expiry is None:
+			self._expires_at = None
+			return
+
+		now = ticks_ms()
+		lifetime_ms = min(max(0, int((expiry - datetime.now(timezone.utc)).total_seconds() * 1000)), self.MAX_LIFETIME_MS)
+		threshold_ms = int(self.REFRESH_THRESHOLD.total_seconds() * 1000)
+
+		self._lifetime_ms = lifetime_ms
+		self._stale_at = ticks_add(now, max(0, lifetime_ms - threshold_ms))
+		self._expires_at = ticks_add(now, lifetime_ms)
+
+		# Measured from this clock's own reading, since MicroPython ports differ in its epoch.
+		self._wall_expires_at = int(time()) + lifetime_ms // 1000
+
 
 	@property
 	def valid (self) -> bool:
-		return self.token_state in (self.TokenState.FRESH, self.TokenState.STALE)
+		return self.token_state != self.TokenState.INVALID
 
 
 	@property
@@ -73,16 +149,15 @@ class BaseCredentials:
 			return self.TokenState.INVALID
 
 		# Credentials that can't expire are always treated as fresh.
-		if self.expiry is None:
+		if (expires_at := self._expires_at) is None:
 			return self.TokenState.FRESH
 
-		now = datetime.now(timezone.utc)
+		now = ticks_ms()
 
-		if now >= self.expiry:
+		if not 0 < ticks_diff(expires_at, now) <= self._lifetime_ms or time() >= self._wall_expires_at:
 			return self.TokenState.INVALID
 
-		is_stale = now >= (self.expiry - self.REFRESH_THRESHOLD)
-		if is_stale:
+		if ticks_diff(self._stale_at, now) <= 0:
 			return self.TokenState.STALE
 
 		return self.TokenState.FRESH
@@ -92,14 +167,187 @@ class BaseCredentials:
 		raise NotImplementedError("_make_authorization_grant_assertion must be implemented")
 
 
-	def refresh (self, request: BaseRequest):
+	@property
+	def _cache_key (self) -> tuple | None:
+		"""Identifies credentials that can share access tokens, or ``None`` if these can't."""
+
+		return None
+
+
+	@property
+	def _flight_key (self) -> object:
+		# Credentials sharing a token cache also share refreshes, the rest only coalesce with themselves.
+		if self._token_cache is not None and (key := self._cache_key) is not None:
+			return key
+
+		return self
+
+
+	def _cached_token (self) -> tuple[str, datetime | None] | None:
+		"""Returns a fresh token obtained by equivalent credentials, if there is one."""
+
+		if self._token_cache is None or (key := self._cache_key) is None:
+			return None
+
+		if (entry := self._token_cache.get(key)) is None:
+			instrumentation.increment('token_cache.miss')
+			return None
+
+		token, expiry = entry
+
+		# Don't hand back the token that's being replaced, or one that's about to go stale.
+		if token == self.token or (expiry is not None and datetime.now(timezone.utc) >= expiry - self.REFRESH_THRESHOLD):
+			instrumentation.increment('token_cache.miss')
+			return None
+
+		instrumentation.increment('token_cache.hit')
+		return entry
+
+
+	def _cache_token (self, token: str, expiry: datetime | None) -> None:
+		if self._token_cache is None or (key := self._cache_key) is None:
+			return
+
+		self._token_cache.set(key, token, expiry)
+
+
+	def _restore_stored_token (self) -> None:
+		"""Adopts the token persisted by an earlier run, unless a token was already provided.
+
+		Subclasses call this once their cache key can be computed.
+		"""
+
+		if self.token is not None or self._token_store is None or (key := self._cache_key) is None:
+			return
 
+		if (entry := self._token_store.load(key)) is not None:
+			self.token, self.expiry = entry
+
+
+	def _persist_token (self) -> None:
+		if self._token_store is None or (key := self._cache_key) is None:
+			return
+
+		try:
+			self._token_store.save(key, self.token, self.expiry)
+
+		except OSError:
+			# The store is only a cache. A full or failing flash mustn't fail a refresh that succeeded.
+			pass
+
+
+	def _fetch_token (self, request: BaseRequest, retry: 'ExponentialBackoff | None') -> tuple[str, datetime | None]:
+		from google.oauth2.client import jwt_grant
+
+		if (entry := self._cached_token()) is not None:
+			return entry
+
+		started = instrumentation.start()
 		assertion = self._make_authorization_grant_assertion()
-		self.token, self.expiry, _ = jwt_grant(request, self._token_uri, assertion)
+		instrumentation.stop('assertion', started)
+
+		token, expiry, _ = jwt_grant(request, self._token_uri, assertion, retry = retry)
+
+		self._cache_token(token, expiry)
+		return token, expiry
+
+
+	async def _fetch_token_async (self, request: AsyncBaseRequest, retry: 'ExponentialBackoff | None') -> tuple[str, datetime | None]:
+		from google.oauth2.client_async import jwt_grant as jwt_grant_async
+
+		if (entry := self._cached_token()) is not None:
+			return entry
+
+		started = instrumentation.start()
+		assertion = self._make_authorization_grant_assertion()
+		instrumentation.stop('assertion', started)
+
+		token, expiry, _ = await jwt_grant_async(request, self._token_uri, assertion, retry = retry)
+
+		self._cache_token(token, expiry)
+		return token, expiry
+
+
+	def refresh (self, request: BaseRequest, retry: 'ExponentialBackoff | None' = None):
+		"""Obtains a new token. Concurrent callers share a single refresh, and its result or error.
+
+		Pass ``retry`` to bound how long the token endpoint is retried, e.g. ``ExponentialBackoff(deadline_seconds = 5)``.
+		It's copied for each refresh, so one instance can be shared by every caller.
+		"""
+
+		started = instrumentation.start()
+		try:
+			self.token, self.expiry = _REFRESH_FLIGHTS.do(self._flight_key, self._fetch_token, request, retry)
+
+		except Exception:
+			instrumentation.increment('refresh.failure')
+			raise
+
+		finally:
+			instrumentation.stop('refresh', started)
+
+		self._persist_token()
+
+
+	async def refresh_async (self, request: AsyncBaseRequest, retry: 'ExponentialBackoff | None' = None):
+		"""Like ``refresh``, but the token endpoint is called without blocking the event loop."""
+
+		started = instrumentation.start()
+		try:
+			self.token, self.expiry = await _ASYNC_REFRESH_FLIGHTS.do(self._flight_key, self._fetch_token_async, request, retry)
+
+		except Exception:
+			instrumentation.increment('refresh.failure')
+			raise
+
+		finally:
+			instrumentation.stop('refresh', started)
+
+		self._persist_token()
+
+
+	def before_request (self, request: BaseRequest, headers: dict[str, str]) -> None:
+		"""Makes sure there's a usable token, then applies it to ``headers``.
+
+		With non-blocking refresh a stale token is refreshed in the background while it's still being used, so
+		callers only block when the token is missing or has expired, or when there's no background to refresh in.
+		"""
+
+		state = self.token_state
+		worker = self._refresh_worker
+
+		if state == self.TokenState.STALE and worker is not None and worker.can_start(request):
+			worker.start_refresh(self, request)
+
+		elif state != self.TokenState.FRESH:
+			self.refresh(request)
+
+		self.apply(headers)
+
+
+	async def before_request_async (self, request: AsyncBaseRequest, headers: dict[str, str]) -> None:
+		"""Like ``before_request``, for asynchronous transports."""
+
+		state = self.token_state
+		worker = self._refresh_worker
+
+		if state == self.TokenState.STALE and worker is not None and worker.can_start(request):
+			worker.start_refresh(self, request)
+
+		elif state != self.TokenState.FRESH:
+			await self.refresh_async(request)
+
+		self.apply(headers)
 
 
 	def apply (self, headers: dict[str, str], token: list[str] | None = None) -> None:
-		headers['authorization'] = f"Bearer {token or self.token}"
+		token = token or self.token
+
+		# Only rebuilt when the token changes, since this runs before every API call.
+		if (authorization := self._authorization) is None or authorization[0] is not token:
+			authorization = self._authorization = token, f"Bearer {token}"
+
+		headers['authorization'] = authorization[1]
 
 
 	@property
@@ -0,0 +1,159 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Refreshes many credentials at once, so recovering from an outage takes as long as the slowest refresh, not all of them.
+
+On CPython ``refresh_all`` runs the refreshes on a thread pool, optionally with the RSA signing sent to a pool of
+processes so it isn't serialized by the GIL. MicroPython has no thread pool, so there ``refresh_all_async`` runs the
+refreshes as asyncio tasks through an asynchronous transport.
+
+Both return a ``(credentials, error)`` pair for each of the credentials given, in order. The error is ``None`` when
+the refresh succeeded, leaving the new token on the credentials. One failure never stops the rest of the batch.
+"""
+
+from google.auth.credentials.base import BaseCredentials
+from google.auth.crypt.base import BaseSigner
+from google.auth.transport.base import BaseRequest, AsyncBaseRequest
+
+
+DEFAULT_MAX_WORKERS: int = 8
+
+# Signers rebuilt in a signing process, by key ID and modulus, so each key is only loaded once per process.
+_process_signers: dict[tuple[str | None, int], BaseSigner] = {}
+
+
+
+def _sign_in_process (info: dict, message: bytes) -> bytes:
+	"""Runs in a signing process."""
+
+	key = (info['private_key_id'], info['private_key_components']['n'])
+
+	if (signer := _process_signers.get(key)) is None:
+		from google.auth.crypt.factory import signer_class
+		signer = _process_signers[key] = signer_class().from_service_account_info(info)
+
+	return signer.sign(message)
+
+
+
+def _signing_info (signer: BaseSigner) -> dict | None:
+	"""What a signing process needs to rebuild ``signer``, or ``None`` if it can't be sent to one."""
+
+	try:
+		return signer.to_service_account_info()
+
+	except NotImplementedError:
+		return None
+
+
+
+class _ProcessPoolSigner(BaseSigner):
+	"""Signs in a pool of processes, blocking only the calling thread while it waits."""
+
+	__slots__ = ('_executor', '_info')
+
+	_executor: object
+	_info: dict
+
+
+	def __init__ (self, executor: object, info: dict):
+		self._executor = executor
+		self._info = info
+
+
+	@property
+	def key_id (self) -> str | None:
+		return self._info['private_key_id']
+
+
+	def sign (self, message: bytes) -> bytes:
+		return self._executor.submit(_sign_in_process, self._info, message).result()
+
+
+	def to_service_account_info (self) -> dict:
+		return self._info
+
+
+
+def _refresh (credentials: BaseCredentials, request: BaseRequest, signing_executor: object | None) -> Exception | None:
+	try:
+		# Only credentials that can be copied with another signer, such as service account credentials, qualify.
+		if signing_executor is None or not hasattr(credentials, 'with_signer') or (info := _signing_info(credentials.signer)) is None:
+			credentials.refresh(request)
+			return None
+
+		# A copy signs through the pool, so the credentials themselves, which others may be using, aren't touched.
+		signing_copy = credentials.with_signer(_ProcessPoolSigner(signing_executor, info))
+		signing_copy.refresh(request)
+
+		credentials.token, credentials.expiry = signing_copy.token, signing_copy.expiry
+
+	except Exception as exc:
+		return exc
+
+	return None
+
+
+
+def refresh_all (credentials: list[BaseCredentials], request: BaseRequest, max_workers: int | None = None, signing_processes: int = 0) -> list[tuple[BaseCredentials, Exception | None]]:
+	"""Refreshes every one of ``credentials`` concurrently, on up to ``max_workers`` threads.
+
+	With ``signing_processes`` above zero, service account credentials sign their assertions in that many processes,
+	which pays off on multi-core hosts using the pure-Python signer. CPython only.
+	"""
+
+	from concurrent.futures import ThreadPoolExecutor
+
+	if max_workers is None:
+		max_workers = DEFAULT_MAX_WORKERS
+
+	signing_executor = None
+	if signing_processes > 0:
+		from concurrent.futures import ProcessPoolExecutor
+		signing_executor = ProcessPoolExecutor(signing_processes)
+
+	try:
+		with ThreadPoolExecutor(max(1, min(max_workers, len(credentials)))) as executor:
+			errors = list(executor.map(lambda i: _refresh(i, request, signing_executor), credentials))
+
+	finally:
+		if signing_executor is not None:
+			signing_executor.shutdown()
+
+	return list(zip(credentials, errors))
+
+
+
+async def _refresh_async (credentials: BaseCredentials, request: AsyncBaseRequest) -> Exception | None:
+	try:
+		await credentials.refresh_async(request)
+
+	except Exception as exc:
+		return exc
+
+	return None
+
+
+
+async def refresh_all_async (credentials: list[BaseCredentials], request: AsyncBaseRequest) -> list[tuple[BaseCredentials, Exception | None]]:
+	"""Refreshes every one of ``credentials`` concurrently, as asyncio tasks.
+
+	Only the token endpoint round-trips overlap. Signing still runs on the event loop, one assertion at a time.
+	"""
+
+	from asyncio import gather
+
+	errors = await gather(*(_refresh_async(i, request) for i in credentials))
+
+	return list(zip(credentials, errors))
@@ -0,0 +1,106 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A process-wide cache of access tokens shared between equivalent credentials."""
+
+from collections import OrderedDict
+from datetime import datetime
+
+from google.auth.util.helpers import utcnow
+from google.auth.util.locks import allocate_lock
+
+
+
+class TokenCache:
+	"""A size-bounded LRU cache mapping credential cache keys to ``(token, expiry)`` pairs.
+
+	Safe to share between threads, such as those of background and bulk refreshes.
+	"""
+
+	__slots__ = ('_entries', '_max_size', '_lock')
+
+	DEFAULT_MAX_SIZE: int = 32
+
+	_entries: OrderedDict
+	_max_size: int
+
+	_lock: object
+
+
+	def __init__ (self, max_size: int | None = None):
+		if max_size is None:
+			max_size = self.DEFAULT_MAX_SIZE
+		self._max_size = max_size
+
+		self._entries = OrderedDict()
+		self._lock = allocate_lock()
+
+
+	def get (self, key: tuple) -> tuple[str, datetime | None] | None:
+		"""Returns the cached token and expiry for ``key``, or ``None`` if there's no unexpired entry."""
+
+		with self._lock:
+			entry: tuple[str, datetime | None] | None = self._entries.pop(key, None)
+			if entry is None:
+				return None
+
+			expiry = entry[1]
+			if expiry is not None and utcnow() >= expiry:
+				return None
+
+			# Re-inserting moves the entry to the most recently used end.
+			self._entries[key] = entry
+			return entry
+
+
+	def set (self, key: tuple, token: str, expiry: datetime | None) -> None:
+		"""Stores a token, evicting expired and then least recently used entries when full."""
+
+		with self._lock:
+			self._entries.pop(key, None)
+			self._entries[key] = (token, expiry)
+
+			if len(self._entries) > self._max_size:
+				self._purge()
+
+			while len(self._entries) > self._max_size:
+				del self._entries[next(iter(self._entries))]
+
+
+	def purge (self) -> None:
+		"""Removes every expired entry."""
+
+		with self._lock:
+			self._purge()
+
+
+	def _purge (self) -> None:
+		now = utcnow()
+
+		for key in [key for key, (_, expiry) in self._entries.items() if expiry is not None and now >= expiry]:
+			del self._entries[key]
+
+
+	def clear (self) -> None:
+		with self._lock:
+			self._entries.clear()
+
+
+	def __len__ (self) -> int:
+		return len(self._entries)
+
+
+
+# Shared by every credential that doesn't specify its own cache.
+DEFAULT_TOKEN_CACHE: TokenCache = TokenCache()
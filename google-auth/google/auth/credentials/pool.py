@@ -0,0 +1,217 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keeps the tokens of many credentials fresh, spreading their refreshes out instead of letting them bunch up."""
+
+from heapq import heappush, heappop
+from datetime import timedelta
+import random
+
+from google.auth.util.locks import allocate_lock
+from google.auth.credentials.base import BaseCredentials
+from google.auth.credentials.refresh_worker import RefreshWorker
+from google.auth.transport.base import BaseRequest, AsyncBaseRequest
+from google.auth.util.helpers import utcnow
+
+
+
+class CredentialPool:
+	"""Owns many credentials and refreshes each ahead of time, at a random point shortly before its token goes stale.
+
+	Credentials created together would otherwise all go stale, and refresh, together. Call ``refresh_due`` regularly,
+	from a main loop or timer, to start the refreshes that are due. They run in the background, like those of
+	``non_blocking_refresh`` credentials, and no more than ``max_concurrent`` at once. On ports without threads that
+	takes an asynchronous transport and a running event loop, though ``get_token`` can still refresh on the spot.
+	"""
+
+	DEFAULT_MAX_CONCURRENT: int = 4
+
+	# How far ahead of going stale a refresh can be scheduled.
+	DEFAULT_JITTER: timedelta = timedelta(minutes = 10)
+
+	# How long to wait before trying a failed refresh again.
+	RETRY_DELAY: timedelta = timedelta(seconds = 30)
+
+	# How often ``next_due`` asks to be polled while refreshes are running, so they can be rescheduled.
+	POLL_INTERVAL_SECONDS: float = 1.0
+
+	_max_concurrent: int
+	_jitter_seconds: float
+
+	_credentials: dict[object, BaseCredentials]
+	_workers: dict[object, RefreshWorker]
+
+	# A heap of ``(due timestamp, sequence, key)``. Entries whose sequence is no longer the key's are skipped.
+	_schedule: list[tuple[float, int, object]]
+	_sequences: dict[object, int]
+	_next_sequence: int
+
+	_in_flight: set
+	_lock: object
+
+
+	def __init__ (self, max_concurrent: int | None = None, jitter: timedelta | None = None):
+		if max_concurrent is None:
+			max_concurrent = self.DEFAULT_MAX_CONCURRENT
+		self._max_concurrent = max_concurrent
+
+		if jitter is None:
+			jitter = self.DEFAULT_JITTER
+		self._jitter_seconds = jitter.total_seconds()
+
+		self._credentials = {}
+		self._workers = {}
+
+		self._schedule = []
+		self._sequences = {}
+		self._next_sequence = 0
+
+		self._in_flight = set()
+		self._lock = allocate_lock()
+
+
+	def add (self, key: object, credentials: BaseCredentials) -> None:
+		"""Adds ``credentials`` under ``key``, replacing any already there, and schedules their refresh."""
+
+		with self._lock:
+			self._credentials[key] = credentials
+			self._workers[key] = RefreshWorker()
+			self._in_flight.discard(key)
+			self._schedule_refresh(key)
+
+
+	def remove (self, key: object) -> None:
+		with self._lock:
+			del self._credentials[key]
+			del self._workers[key]
+			self._sequences.pop(key, None)
+			self._in_flight.discard(key)
+
+
+	def get (self, key: object) -> BaseCredentials:
+		return self._credentials[key]
+
+
+	def get_token (self, key: object, request: BaseRequest | None = None) -> str | None:
+		"""Returns the token for ``key``.
+
+		If the token isn't usable it's refreshed on the spot when ``request`` is given, otherwise ``None`` is returned.
+		"""
+
+		credentials = self._credentials[key]
+
+		if credentials.valid:
+			return credentials.token
+
+		if request is None:
+			return None
+
+		credentials.refresh(request)
+
+		with self._lock:
+			if key in self._credentials:
+				self._schedule_refresh(key)
+
+		return credentials.token
+
+
+	def _schedule_refresh (self, key: object, failed: bool = False) -> None:
+		"""Works out when the credentials under ``key`` next need refreshing, ``failed`` if their last refresh did.
+
+		The lock must be held.
+		"""
+
+		credentials = self._credentials[key]
+		now = utcnow().timestamp()
+
+		if failed:
+			due = now + self.RETRY_DELAY.total_seconds()
+
+		elif credentials.token is None:
+			due = now
+
+		elif credentials.expiry is None:
+			# Never expires, so never needs refreshing.
+			self._sequences.pop(key, None)
+			return
+
+		else:
+			stale_at = (credentials.expiry - credentials.REFRESH_THRESHOLD).timestamp()
+			due = max(now, stale_at - random.uniform(0, self._jitter_seconds))
+
+		sequence = self._next_sequence
+		self._next_sequence += 1
+
+		self._sequences[key] = sequence
+		heappush(self._schedule, (due, sequence, key))
+
+
+	def refresh_due (self, request: BaseRequest | AsyncBaseRequest) -> int:
+		"""Starts background refreshes for the credentials that are due, returning how many were started."""
+
+		started = 0
+
+		with self._lock:
+			# Reschedule the credentials whose refresh has finished, using their new expiry.
+			for key in [key for key in self._in_flight if not self._workers[key].running]:
+				self._in_flight.discard(key)
+				# Only here is the worker's error from the refresh being rescheduled, elsewhere it may be stale.
+				self._schedule_refresh(key, self._workers[key].last_error is not None)
+
+			now = utcnow().timestamp()
+
+			while self._schedule and self._schedule[0][0] <= now and len(self._in_flight) < self._max_concurrent:
+				_, sequence, key = heappop(self._schedule)
+
+				if self._sequences.get(key) != sequence:
+					continue
+
+				del self._sequences[key]
+
+				if self._workers[key].start_refresh(self._credentials[key], request):
+					self._in_flight.add(key)
+					started += 1
+
+				else:
+					# Already refreshing, or unable to start, so it's rescheduled once no refresh is running.
+					self._in_flight.add(key)
+
+		return started
+
+
+	@property
+	def next_due (self) -> float | None:
+		"""Seconds until ``refresh_due`` next has work to do, or ``None`` if nothing is scheduled or running."""
+
+		with self._lock:
+			while self._schedule and self._sequences.get(self._schedule[0][2]) != self._schedule[0][1]:
+				heappop(self._schedule)
+
+			wait = None
+			if self._schedule:
+				wait = max(0.0, self._schedule[0][0] - utcnow().timestamp())
+
+			# Finished refreshes are only rescheduled by ``refresh_due``.
+			if self._in_flight and (wait is None or wait > self.POLL_INTERVAL_SECONDS):
+				wait = self.POLL_INTERVAL_SECONDS
+
+			return wait
+
+
+	def __len__ (self) -> int:
+		return len(self._credentials)
+
+
+	def __contains__ (self, key: object) -> bool:
+		return key in self._credentials
@@ -0,0 +1,135 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Refreshes stale credentials in the background so callers can keep using the current token."""
+
+from google.auth.util.locks import allocate_lock
+from google.auth.transport.base import AsyncBaseRequest
+
+
+try:
+	from _thread import start_new_thread as _start_new_thread
+
+except ImportError:
+	# Ports built without threads, such as the ESP8266.
+	_start_new_thread = None
+
+
+
+def _event_loop_running () -> bool:
+	try:
+		from asyncio import current_task
+
+		# Raises when called outside a running event loop, on CPython and MicroPython alike.
+		current_task()
+
+	except (ImportError, RuntimeError):
+		return False
+
+	return True
+
+
+
+class RefreshWorker:
+	"""Runs at most one background refresh at a time.
+
+	Refreshes through an asynchronous transport run as an asyncio task, but only while an event loop is running to
+	run it. Refreshes through a synchronous transport run on their own thread, so not at all on ports without
+	threads. ``can_start`` tells callers when there's no background to refresh in, so they can refresh themselves.
+	"""
+
+	# Held for as long as a refresh is running.
+	_lock: object
+	_last_error: Exception | None
+
+	# Kept so the event loop's weak reference isn't the only one.
+	_task: object | None
+
+
+	def __init__ (self):
+		self._lock = allocate_lock()
+		self._last_error = None
+		self._task = None
+
+
+	@property
+	def running (self) -> bool:
+		return self._lock.locked()
+
+
+	@property
+	def last_error (self) -> Exception | None:
+		"""The error raised by the most recent background refresh, if it failed."""
+
+		return self._last_error
+
+
+	@staticmethod
+	def can_start (request) -> bool:
+		"""Whether a refresh through ``request`` can run in the background here."""
+
+		if isinstance(request, AsyncBaseRequest):
+			return _event_loop_running()
+
+		return _start_new_thread is not None
+
+
+	def start_refresh (self, credentials, request) -> bool:
+		"""Starts refreshing ``credentials`` in the background, returning whether it did. Never blocks.
+
+		It doesn't while a refresh is already running, or when ``can_start`` says it can't.
+		"""
+
+		if not self.can_start(request) or not self._lock.acquire(False):
+			return False
+
+		try:
+			if isinstance(request, AsyncBaseRequest):
+				from asyncio import create_task
+				self._task = create_task(self._refresh_task(credentials, request))
+
+			else:
+				_start_new_thread(self._refresh, (credentials, request))
+
+		except BaseException:
+			self._lock.release()
+			raise
+
+		return True
+
+
+	def _refresh (self, credentials, request) -> None:
+		try:
+			credentials.refresh(request)
+			self._last_error = None
+
+		except Exception as exc:
+			# Nothing is waiting on the result. If the token runs out the next blocking refresh will raise instead.
+			self._last_error = exc
+
+		finally:
+			self._lock.release()
+
+
+	async def _refresh_task (self, credentials, request) -> None:
+		try:
+			await credentials.refresh_async(request)
+			self._last_error = None
+
+		except Exception as exc:
+			self._last_error = exc
+
+		finally:
+			self._task = None
+			self._lock.release()
@@ -0,0 +1,156 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persists an access token to flash or disk so it survives reboots and deep sleep."""
+
+from datetime import datetime, timezone
+from hashlib import sha256
+from binascii import hexlify
+import os
+
+from google.auth.util.helpers import utcnow
+
+
+# MicroPython has no ``os.fsync``, its filesystems commit on close.
+_fsync = getattr(os, 'fsync', None)
+
+
+
+def _replace (source: str, destination: str) -> None:
+	"""Renames ``source`` over ``destination``, which may already exist."""
+
+	if hasattr(os, 'replace'):
+		os.replace(source, destination)
+		return
+
+	# MicroPython has no ``os.replace``, and its FAT filesystem won't rename over an existing file. The old file is
+	# removed first, so a reset in between loses the stored token, which only costs a refresh.
+	try:
+		os.remove(destination)
+
+	except OSError:
+		pass
+
+	os.rename(source, destination)
+
+
+
+def _create_private (path: str):
+	"""Opens a new file at ``path`` for writing, readable only by its owner where the filesystem has permissions."""
+
+	# MicroPython has no ``os.open``, nor permissions on its filesystems.
+	if not hasattr(os, 'open'):
+		return open(path, 'wb')
+
+	# A file left behind by an interrupted write keeps its own permissions, so it's replaced rather than reused.
+	try:
+		os.remove(path)
+
+	except OSError:
+		pass
+
+	return os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), 'wb')
+
+
+
+class FileTokenStore:
+	"""Keeps a single token in a file, which should only be shared by credentials with the same cache key.
+
+	The file holds three lines: a digest of the cache key, the expiry as a UNIX timestamp (``-`` if the
+	token doesn't expire) and the token itself.
+	"""
+
+	_path: str
+	_temporary_path: str
+
+	# The file's contents as last read or written, used to skip redundant writes.
+	_contents: bytes | None
+
+
+	def __init__ (self, path: str):
+		self._path = path
+		self._temporary_path = path + '.tmp'
+		self._contents = None
+
+
+	@staticmethod
+	def _key_digest (key: tuple) -> bytes:
+		return hexlify(sha256(repr(key).encode('utf-8')).digest()[:8])
+
+
+	def load (self, key: tuple) -> tuple[str, datetime | None] | None:
+		"""Returns the stored token and expiry, or ``None`` if it's missing, expired or for another key."""
+
+		try:
+			with open(self._path, 'rb') as token_file:
+				contents: bytes = token_file.read()
+
+			self._contents = contents
+
+			digest, expiry_timestamp, token = contents.split(b'\n', 2)
+
+			if digest != self._key_digest(key) or not token:
+				return None
+
+			expiry: datetime | None = None
+			if expiry_timestamp != b'-':
+				expiry = datetime.fromtimestamp(int(expiry_timestamp), timezone.utc)
+
+				if utcnow() >= expiry:
+					return None
+
+			return token.decode('utf-8'), expiry
+
+		except (OSError, ValueError):
+			# Missing or corrupt, either way there's nothing to use.
+			return None
+
+
+	def save (self, key: tuple, token: str, expiry: datetime | None) -> None:
+		"""Writes the token to a temporary file then renames it into place, so readers never see a partial write."""
+
+		expiry_timestamp: bytes = b'-' if expiry is None else str(int(expiry.timestamp())).encode('utf-8')
+		contents: bytes = b'\n'.join((self._key_digest(key), expiry_timestamp, token.encode('utf-8')))
+
+		# Flash has limited write cycles, so don't rewrite what's already there.
+		if contents == self._contents:
+			return
+
+		try:
+			# The token is a bearer credential, so the file isn't left readable by anyone else.
+			with _create_private(self._temporary_path) as token_file:
+				token_file.write(contents)
+
+				if _fsync is not None:
+					token_file.flush()
+					_fsync(token_file.fileno())
+
+			_replace(self._temporary_path, self._path)
+
+		except OSError:
+			# The file may be gone or only half replaced, so don't trust what was last read or written.
+			self._contents = None
+			raise
+
+		self._contents = contents
+
+
+	def clear (self) -> None:
+		try:
+			os.remove(self._path)
+
+		except OSError:
+			pass
+
+		self._contents = None
@@ -15,10 +15,17 @@
 """Base classes for cryptographic signers and verifiers."""
 
 
+# The RSA private key components every signer needs, the CRT parameters can be derived from them. Kept here so
+# checking for them doesn't load a signer.
+RSA_PRIVATE_KEY_COMPONENTS: set = {'n', 'e', 'd', 'p', 'q'}
+
+
 
 class BaseSigner:
 	"""Abstract base class for cryptographic signers."""
 
+	__slots__ = ()
+
 
 	@property
 	def key_id (self):
@@ -31,3 +38,22 @@ class BaseSigner:
 		"""Signs a message."""
 
 		raise NotImplementedError("Sign must be implemented")
+
+
+	def to_service_account_info (self) -> dict:
+		"""The key fields of service account info that recreate this signer with ``from_service_account_info``."""
+
+		raise NotImplementedError("to_service_account_info must be implemented")
+
+
+
+class BaseVerifier:
+	"""Abstract base class for cryptographic signature verifiers."""
+
+	__slots__ = ()
+
+
+	def verify (self, message: str | bytes, signature: bytes) -> bool:
+		"""Checks that ``signature`` is a valid signature of ``message``."""
+
+		raise NotImplementedError("Verify must be implemented")
@@ -0,0 +1,49 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""RSA signing backed by the native ``cryptography`` library.
+
+Only importable where ``cryptography`` is installed, which rules out MicroPython.
+"""
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey as NativePrivateKey, RSAPrivateNumbers, RSAPublicNumbers
+
+from google.auth.crypt.rsa import RSASigner
+from google.auth import instrumentation
+
+
+
+class CryptographyRSASigner(RSASigner):
+	"""Produces the same PKCS#1 v1.5 SHA-256 signatures as ``RSASigner``, using OpenSSL."""
+
+	__slots__ = ('_native_key',)
+
+	_native_key: NativePrivateKey
+
+
+	def __init__ (self, private_key: dict[str, int], key_id: str):
+		super().__init__(private_key, key_id)
+
+		key = self._key
+		self._native_key = RSAPrivateNumbers(p = key.p, q = key.q, d = key.d, dmp1 = key.dp, dmq1 = key.dq, iqmp = key.qinv, public_numbers = RSAPublicNumbers(e = key.e, n = key.n)).private_key()
+
+
+	def sign (self, message: bytes) -> bytes:
+		started = instrumentation.start()
+		signature = self._native_key.sign(message, padding.PKCS1v15(), hashes.SHA256())
+		instrumentation.stop('sign', started)
+
+		return signature
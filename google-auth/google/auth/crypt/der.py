@@ -0,0 +1,83 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Just enough DER to read RSA private keys out of the PEM in Google's service account JSON."""
+
+from binascii import a2b_base64
+
+from google.auth.exceptions import MalformedError
+
+
+_INTEGER: int = 0x02
+_OCTET_STRING: int = 0x04
+_SEQUENCE: int = 0x30
+
+# The integers of a PKCS#1 ``RSAPrivateKey``, after its version.
+RSA_PRIVATE_KEY_COMPONENTS: tuple[str, ...] = ('n', 'e', 'd', 'p', 'q', 'dp', 'dq', 'qinv')
+
+
+
+def _read_element (der: bytes, offset: int, tag: int) -> tuple[int, int]:
+	"""Returns where the contents of the element at ``offset`` start and end."""
+
+	if offset + 2 > len(der) or der[offset] != tag:
+		raise MalformedError("The private key is not in the expected DER format.")
+
+	length = der[offset + 1]
+	offset += 2
+
+	# Long form lengths give the number of length bytes that follow.
+	if length & 0x80:
+		count = length & 0x7f
+		length = int.from_bytes(der[offset:offset + count], 'big')
+		offset += count
+
+	if offset + length > len(der):
+		raise MalformedError("The private key is truncated.")
+
+	return offset, offset + length
+
+
+
+def pem_to_der (pem: str) -> bytes:
+	"""Strips the armour from a PEM block and decodes it."""
+
+	lines = pem.strip().splitlines()
+
+	if not lines or not lines[0].startswith('-----BEGIN '):
+		raise MalformedError("The private key is not PEM encoded.")
+
+	return a2b_base64(''.join(line for line in lines if not line.startswith('-----')))
+
+
+
+def parse_rsa_private_key (der: bytes) -> dict[str, int]:
+	"""Reads the components of a PKCS#1 RSA private key, which may be wrapped in PKCS#8."""
+
+	start, end = _read_element(der, 0, _SEQUENCE)
+	_, offset = _read_element(der, start, _INTEGER)
+
+	# PKCS#8 follows the version with an algorithm identifier, then the PKCS#1 key as an octet string.
+	if offset < end and der[offset] == _SEQUENCE:
+		_, offset = _read_element(der, offset, _SEQUENCE)
+		key_start, key_end = _read_element(der, offset, _OCTET_STRING)
+
+		return parse_rsa_private_key(der[key_start:key_end])
+
+	components: dict[str, int] = {}
+	for name in RSA_PRIVATE_KEY_COMPONENTS:
+		start, offset = _read_element(der, offset, _INTEGER)
+		components[name] = int.from_bytes(der[start:offset], 'big')
+
+	return components
@@ -0,0 +1,97 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Selects the fastest signer implementation available on this interpreter."""
+
+from google.auth.crypt.base import BaseSigner, RSA_PRIVATE_KEY_COMPONENTS
+from google.auth.exceptions import MalformedError
+
+
+_signer_class: type | None = None
+
+
+
+def signer_class () -> type:
+	"""Returns the native signer when its backend can be imported, falling back to the pure-Python ``RSASigner``."""
+
+	global _signer_class
+
+	if _signer_class is None:
+		try:
+			from google.auth.crypt.cryptography_rsa import CryptographyRSASigner
+			_signer_class = CryptographyRSASigner
+
+		except ImportError:
+			from google.auth.crypt.rsa import RSASigner
+			_signer_class = RSASigner
+
+	return _signer_class
+
+
+
+class LazySigner(BaseSigner):
+	"""Stands in for the real signer until the first signature, so the RSA code and key only load once needed.
+
+	Credentials holding a valid token, or one from a cache or store, may never sign anything.
+	"""
+
+	__slots__ = ('_info', '_signer')
+
+	# Checked up front, so a bad key file still fails when it's loaded.
+	REQUIRED_FIELDS: tuple[str, ...] = ('private_key_components', 'private_key_id')
+
+	_info: dict
+	_signer: BaseSigner | None
+
+
+	def __init__ (self, info: dict[str, str | dict[str, int]]):
+		if missing_fields := set(self.REQUIRED_FIELDS).difference(info.keys()):
+			raise MalformedError(f"Service account info was not in the expected format, missing fields {", ".join(missing_fields)}.")
+
+		if missing_components := RSA_PRIVATE_KEY_COMPONENTS.difference(info['private_key_components'].keys()):
+			raise MalformedError(f"Private key is missing components {', '.join(missing_components)}.")
+
+		self._info = info
+		self._signer = None
+
+
+	@property
+	def key_id (self) -> str | None:
+		return self._info.get('private_key_id')
+
+
+	@property
+	def signer (self) -> BaseSigner:
+		"""The real signer, created on first use."""
+
+		if self._signer is None:
+			self._signer = signer_class().from_service_account_info(self._info)
+
+		return self._signer
+
+
+	def sign (self, message: bytes) -> bytes:
+		return self.signer.sign(message)
+
+
+	def to_service_account_info (self) -> dict[str, str | dict[str, int]]:
+		# Straight from the info, so the real signer isn't built just to be taken apart.
+		return {name: self._info[name] for name in self.REQUIRED_FIELDS}
+
+
+
+def signer_from_service_account_info (info: dict[str, str | dict[str, int]]) -> BaseSigner:
+	"""Creates a signer from parsed service account info using the fastest available backend, once it's first needed."""
+
+	return LazySigner(info)
@@ -12,26 +12,262 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from rsa import pkcs1
-from rsa.key import PrivateKey
+"""RSA signing using Chinese Remainder Theorem exponentiation, and signature verification."""
 
-from google.auth.crypt.base import BaseSigner as BaseSigner
-from google.auth.exceptions import MalformedError
+from hashlib import sha256
+
+from google.auth.crypt.base import BaseSigner as BaseSigner, BaseVerifier as BaseVerifier, RSA_PRIVATE_KEY_COMPONENTS
+from google.auth.exceptions import GoogleAuthError, MalformedError
+from google.auth.util.locks import allocate_lock
+from google.auth.util.helpers import padded_urlsafe_b64decode
+from google.auth import instrumentation
+
+
+# DER encoded ``DigestInfo`` prefix for SHA-256 (RFC 8017, section 9.2).
+SHA256_DIGEST_INFO_PREFIX: bytes = b'\x30\x31\x30\x0d\x06\x09\x60\x86\x48\x01\x65\x03\x04\x02\x01\x05\x00\x04\x20'
+
+# The width of each window used by ``_windowed_pow``.
+WINDOW_BITS: int = 5
+
+
+
+def _byte_length (value: int) -> int:
+	"""Returns the number of bytes required to represent a non-negative integer."""
+
+	length = 0
+	while value:
+		value >>= 8
+		length += 1
+
+	return length
+
+
+
+def _sha256_encoding_prefix (size: int) -> int:
+	"""The PKCS#1 v1.5 encoding of a SHA-256 digest for a ``size`` byte modulus, minus the digest, as an integer."""
+
+	# EM = 0x00 || 0x01 || PS || 0x00 || DigestInfo || digest
+	padding_length = size - len(SHA256_DIGEST_INFO_PREFIX) - 32 - 3
+	if padding_length < 8:
+		raise MalformedError("The key is too short for SHA-256 signatures.")
+
+	prefix = b'\x00\x01' + b'\xff' * padding_length + b'\x00' + SHA256_DIGEST_INFO_PREFIX
+	return int.from_bytes(prefix, 'big') << 256
+
+
+
+def _modular_inverse (value: int, modulus: int) -> int:
+	"""Computes the inverse of ``value`` modulo ``modulus`` with the extended Euclidean algorithm."""
+
+	old_r, r = value % modulus, modulus
+	old_s, s = 1, 0
+
+	while r:
+		quotient = old_r // r
+		old_r, r = r, old_r - quotient * r
+		old_s, s = s, old_s - quotient * s
+
+	if old_r != 1:
+		raise MalformedError("Private key components are not coprime.")
+
+	return old_s % modulus
+
+
+
+def _windowed_pow (base: int, exponent: int, modulus: int) -> int:
+	"""Fixed-window modular exponentiation, for ports built without three argument ``pow``."""
+
+	mask = (1 << WINDOW_BITS) - 1
+
+	table: list[int] = [1, base % modulus]
+	for _ in range(2, 1 << WINDOW_BITS):
+		table.append(table[-1] * base % modulus)
+
+	windows: list[int] = []
+	while exponent:
+		windows.append(exponent & mask)
+		exponent >>= WINDOW_BITS
+
+	result = 1
+	for window in reversed(windows):
+		for _ in range(WINDOW_BITS):
+			result = result * result % modulus
+
+		if window:
+			result = result * table[window] % modulus
+
+	return result
+
+
+
+def _select_pow ():
+	try:
+		pow(2, 3, 5)
+
+	except (TypeError, NotImplementedError):
+		# MicroPython can be built without three argument pow().
+		return _windowed_pow
+
+	return pow
+
+
+_pow = _select_pow()
+
+
+
+def _random_bytes (length: int) -> bytes:
+	try:
+		from os import urandom
+
+	except ImportError:
+		# Some ports have no os.urandom. Blinding only needs values an attacker can't choose, not a secure source.
+		from random import getrandbits
+		return bytes(getrandbits(8) for _ in range(length))
+
+	return urandom(length)
+
+
+
+class RSAPrivateKey:
+	"""An RSA private key with the parameters needed for CRT signing precomputed."""
+
+	__slots__ = ('n', 'e', 'd', 'p', 'q', 'dp', 'dq', 'qinv', 'size', '_encoding_prefix', '_blinding', '_unblinding', '_lock')
+
+	n: int
+	e: int
+	d: int
+	p: int
+	q: int
+	dp: int
+	dq: int
+	qinv: int
+
+	size: int
+
+	# The PKCS#1 v1.5 encoded message, minus the digest, as an integer.
+	_encoding_prefix: int
+
+	# ``r ** e`` and ``r ** -1`` modulo ``n`` for a random ``r``, squared after each signature so no two use the same.
+	_blinding: int
+	_unblinding: int
+
+	_lock: object
+
+
+	def __init__ (self, *, n: int, e: int, d: int, p: int, q: int, dp: int | None = None, dq: int | None = None, qinv: int | None = None):
+		self.n = n
+		self.e = e
+		self.d = d
+		self.p = p
+		self.q = q
+
+		if dp is None:
+			dp = d % (p - 1)
+		self.dp = dp
+
+		if dq is None:
+			dq = d % (q - 1)
+		self.dq = dq
+
+		if qinv is None:
+			qinv = _modular_inverse(q, p)
+		self.qinv = qinv
+
+		self.size = _byte_length(n)
+		self._encoding_prefix = _sha256_encoding_prefix(self.size)
+
+		blinding_factor = int.from_bytes(_random_bytes(self.size), 'big') % (n - 2) + 2
+		self._blinding = _pow(blinding_factor, e, n)
+		self._unblinding = _modular_inverse(blinding_factor, n)
+
+		self._lock = allocate_lock()
+
+
+	def sign_sha256 (self, message: bytes) -> bytes:
+		"""Creates a PKCS#1 v1.5 signature of the SHA-256 digest of ``message``."""
+
+		n = self.n
+		encoded = self._encoding_prefix | int.from_bytes(sha256(message).digest(), 'big')
+
+		# Blinding keeps the time the exponentiations take from depending on the message.
+		with self._lock:
+			blinding, unblinding = self._blinding, self._unblinding
+			self._blinding, self._unblinding = blinding * blinding % n, unblinding * unblinding % n
+
+		blinded = encoded * blinding % n
+
+		# Garner's recombination of the two half-size exponentiations.
+		m1 = _pow(blinded, self.dp, self.p)
+		m2 = _pow(blinded, self.dq, self.q)
+		h = self.qinv * (m1 - m2) % self.p
+
+		signature = (m2 + h * self.q) * unblinding % n
+
+		# A fault in either half would give a signature that reveals a factor of n (the Bellcore attack), so it's
+		# checked before it leaves here. With a small e this costs a fraction of the signing.
+		if _pow(signature, self.e, n) != encoded:
+			raise GoogleAuthError("The RSA signature failed its consistency check.")
+
+		return signature.to_bytes(self.size, 'big')
+
+
+
+class RSAPublicKey:
+	"""An RSA public key with the expected signature encoding precomputed."""
+
+	__slots__ = ('n', 'e', 'size', '_encoding_prefix')
+
+	n: int
+	e: int
+
+	size: int
+
+	# The PKCS#1 v1.5 encoded message, minus the digest, as an integer.
+	_encoding_prefix: int
+
+
+	def __init__ (self, *, n: int, e: int):
+		self.n = n
+		self.e = e
+
+		self.size = _byte_length(n)
+		self._encoding_prefix = _sha256_encoding_prefix(self.size)
+
+
+	def verify_sha256 (self, message: bytes, signature: bytes) -> bool:
+		"""Checks a PKCS#1 v1.5 signature of the SHA-256 digest of ``message``."""
+
+		if len(signature) != self.size:
+			return False
+
+		value = int.from_bytes(signature, 'big')
+		if value >= self.n:
+			return False
+
+		# Comparing whole encodings, rather than parsing the decrypted one, leaves no padding to be lenient about.
+		return _pow(value, self.e, self.n) == self._encoding_prefix | int.from_bytes(sha256(message).digest(), 'big')
 
 
 
 class RSASigner(BaseSigner):
-	PRIVATE_KEY_COMPONENTS: set = {'n', 'e', 'd', 'p', 'q'}
+	__slots__ = ('_key', '_key_id')
+
+	PRIVATE_KEY_COMPONENTS: set = RSA_PRIVATE_KEY_COMPONENTS
+	PRECOMPUTED_KEY_COMPONENTS: set = {'dp', 'dq', 'qinv'}
 
 	SERVICE_ACCOUNT_INFO_PRIVATE_KEY: str = 'private_key_components'
 	SERVICE_ACCOUNT_INFO_PRIVATE_KEY_ID: str = 'private_key_id'
 
-	_key: PrivateKey
+	_key: RSAPrivateKey
 	_key_id: str
 
 
 	def __init__ (self, private_key: dict[str, int], key_id: str):
-		self._key = PrivateKey(**{i: private_key[i] for i in self.PRIVATE_KEY_COMPONENTS})
+		if missing_components := self.PRIVATE_KEY_COMPONENTS.difference(private_key.keys()):
+			raise MalformedError(f"Private key is missing components {', '.join(missing_components)}.")
+
+		components = self.PRIVATE_KEY_COMPONENTS | self.PRECOMPUTED_KEY_COMPONENTS
+		self._key = RSAPrivateKey(**{i: private_key[i] for i in components if i in private_key})
 		self._key_id = key_id
 
 
@@ -41,7 +277,18 @@ class RSASigner(BaseSigner):
 
 
 	def sign (self, message: bytes) -> bytes:
-		return pkcs1.sign(message, self._key, 'SHA-256')
+		started = instrumentation.start()
+		signature = self._key.sign_sha256(message)
+		instrumentation.stop('sign', started)
+
+		return signature
+
+
+	def to_service_account_info (self) -> dict[str, str | dict[str, int]]:
+		key = self._key
+		components = {'n': key.n, 'e': key.e, 'd': key.d, 'p': key.p, 'q': key.q, 'dp': key.dp, 'dq': key.dq, 'qinv': key.qinv}
+
+		return {self.SERVICE_ACCOUNT_INFO_PRIVATE_KEY: components, self.SERVICE_ACCOUNT_INFO_PRIVATE_KEY_ID: self._key_id}
 
 
 	@classmethod
@@ -52,3 +299,35 @@ class RSASigner(BaseSigner):
 			raise MalformedError(f"Service account info was not in the expected format, missing fields {", ".join(missing_fields)}.")
 
 		return cls(info[cls.SERVICE_ACCOUNT_INFO_PRIVATE_KEY], info.get(cls.SERVICE_ACCOUNT_INFO_PRIVATE_KEY_ID))
+
+
+
+class RSAVerifier(BaseVerifier):
+	__slots__ = ('_key',)
+
+	_key: RSAPublicKey
+
+
+	def __init__ (self, n: int, e: int):
+		self._key = RSAPublicKey(n = n, e = e)
+
+
+	def verify (self, message: str | bytes, signature: bytes) -> bool:
+		if isinstance(message, str):
+			message = message.encode('utf-8')
+
+		started = instrumentation.start()
+		valid = self._key.verify_sha256(message, signature)
+		instrumentation.stop('verify', started)
+
+		return valid
+
+
+	@classmethod
+	def from_jwk (cls, jwk: dict[str, str]) -> 'RSAVerifier':
+		"""Creates a ``RSAVerifier`` instance from an RSA JSON Web Key (RFC 7517)."""
+
+		if jwk.get('kty') != 'RSA' or not {'n', 'e'}.issubset(jwk.keys()):
+			raise MalformedError("The JSON Web Key is not an RSA public key.")
+
+		return cls(int.from_bytes(padded_urlsafe_b64decode(jwk['n']), 'big'), int.from_bytes(padded_urlsafe_b64decode(jwk['e']), 'big'))
@@ -45,3 +45,8 @@ class DefaultCredentialsError(GoogleAuthError):
 
 class MalformedError(DefaultCredentialsError):
 	"""An exception for malformed data."""
+
+
+
+class InvalidValue(DefaultCredentialsError):
+	"""Used to indicate an invalid value, such as a token that fails verification."""
@@ -0,0 +1,172 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-phase timings and counters for the refresh path, reported through a pluggable sink.
+
+Nothing is measured until a sink is installed with ``set_sink``. Until then each instrumented phase costs two
+function calls that return straight away.
+
+Durations are reported for these phases:
+
+* ``refresh``: a whole ``BaseCredentials.refresh``, including waiting on another caller's refresh
+* ``assertion``: building and signing the authorization grant assertion
+* ``jwt.encode``: building and signing a JWT
+* ``sign``: the RSA signature alone
+* ``token_request``: a whole token endpoint request, including retries
+* ``http``: a single HTTP attempt
+* ``parse``: decoding the token endpoint's response
+* ``backoff``: sleeping between retries
+* ``verify``: checking a signature, when verifying tokens
+
+And these counters: ``refresh.failure``, ``token_request.retry``, ``token_request.failure``,
+``token_request.budget_exhausted``, ``token_cache.hit`` and ``token_cache.miss``.
+"""
+
+from google.auth.util.locks import allocate_lock
+from google.auth.util.ticks import ticks_us, ticks_diff
+
+
+
+class BaseSink:
+	"""Receives measurements. Implementations should be quick, since they run on the refresh path.
+
+	Background and bulk refreshes report from their own threads, so implementations must be thread safe.
+	"""
+
+
+	def record_duration (self, name: str, microseconds: int) -> None:
+		raise NotImplementedError("record_duration must be implemented.")
+
+
+	def increment (self, name: str, amount: int = 1) -> None:
+		raise NotImplementedError("increment must be implemented.")
+
+
+
+class MemorySink(BaseSink):
+	"""Aggregates measurements in memory, for periodic collection by the application's own telemetry.
+
+	Safe to share between threads. Read ``durations`` and ``counters`` while holding ``lock``, or use ``collect``.
+	"""
+
+	# Count, total and maximum microseconds by phase.
+	durations: dict[str, list[int]]
+	counters: dict[str, int]
+
+	lock: object
+
+
+	def __init__ (self):
+		self.durations = {}
+		self.counters = {}
+		self.lock = allocate_lock()
+
+
+	def record_duration (self, name: str, microseconds: int) -> None:
+		with self.lock:
+			if (duration := self.durations.get(name)) is None:
+				self.durations[name] = [1, microseconds, microseconds]
+				return
+
+			duration[0] += 1
+			duration[1] += microseconds
+
+			if microseconds > duration[2]:
+				duration[2] = microseconds
+
+
+	def increment (self, name: str, amount: int = 1) -> None:
+		with self.lock:
+			self.counters[name] = self.counters.get(name, 0) + amount
+
+
+	def mean_duration (self, name: str) -> float | None:
+		"""The mean microseconds spent in a phase, or ``None`` if it hasn't run."""
+
+		with self.lock:
+			if (duration := self.durations.get(name)) is None:
+				return None
+
+			return duration[1] / duration[0]
+
+
+	@property
+	def cache_hit_rate (self) -> float | None:
+		"""The fraction of token fetches answered by the shared token cache, or ``None`` before any."""
+
+		with self.lock:
+			hits = self.counters.get('token_cache.hit', 0)
+			lookups = hits + self.counters.get('token_cache.miss', 0)
+
+		return hits / lookups if lookups else None
+
+
+	def collect (self) -> tuple[dict[str, list[int]], dict[str, int]]:
+		"""Returns the durations and counters so far and starts afresh, so no measurement is counted twice or lost."""
+
+		with self.lock:
+			collected = self.durations, self.counters
+			self.durations = {}
+			self.counters = {}
+
+		return collected
+
+
+	def reset (self) -> None:
+		with self.lock:
+			self.durations.clear()
+			self.counters.clear()
+
+
+
+_sink: BaseSink | None = None
+
+
+
+def set_sink (sink: BaseSink | None) -> None:
+	"""Installs the sink that receives every measurement from now on, or disables instrumentation with ``None``."""
+
+	global _sink
+	_sink = sink
+
+
+
+def get_sink () -> BaseSink | None:
+	return _sink
+
+
+
+def start () -> int:
+	"""Starts timing a phase. Pass the result to ``stop``."""
+
+	if _sink is None:
+		return 0
+
+	return ticks_us()
+
+
+
+def stop (name: str, started: int) -> None:
+	"""Reports the duration of a phase started with ``start``."""
+
+	if _sink is None or not started:
+		return
+
+	_sink.record_duration(name, ticks_diff(ticks_us(), started))
+
+
+
+def increment (name: str, amount: int = 1) -> None:
+	if _sink is not None:
+		_sink.increment(name, amount)
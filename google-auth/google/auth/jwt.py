@@ -14,14 +14,19 @@
 
 from json import dumps as dump_json_string
 
+from google.auth.util.locks import allocate_lock
 from google.auth.util.helpers import unpadded_urlsafe_b64encode
+from google.auth.util.base64url import encoded_length, encode_into
 from google.auth.crypt.base import BaseSigner
+from google.auth import instrumentation
 
 
+# Shared by every ``JWTTemplate`` to assemble tokens in, one caller at a time.
+_scratch: bytearray = bytearray()
+_scratch_lock: object = allocate_lock()
 
-def encode (signer: BaseSigner, payload: dict[str, str], header: dict[str, str] | None = None, key_id: str | None = None) -> bytes:
-	"""Make a signed JWT."""
 
+def _make_header (signer: BaseSigner, header: dict[str, str] | None, key_id: str | None) -> dict[str, str]:
 	if header is None:
 		header = {}
 
@@ -36,8 +41,120 @@ def encode (signer: BaseSigner, payload: dict[str, str], header: dict[str, str]
 	if key_id is not None:
 		header['kid'] = key_id
 
+	return header
+
+
+
+def encode (signer: BaseSigner, payload: dict[str, str], header: dict[str, str] | None = None, key_id: str | None = None) -> bytes:
+	"""Make a signed JWT."""
+
+	started = instrumentation.start()
+
+	header = _make_header(signer, header, key_id)
+
 	segments: list[bytes] = [unpadded_urlsafe_b64encode(dump_json_string(seg).encode('utf-8')) for seg in (header, payload)]
 	signature = unpadded_urlsafe_b64encode(signer.sign(b'.'.join(segments)))
 	segments.append(signature)
 
-	return b'.'.join(segments)
+	token = b'.'.join(segments)
+	instrumentation.stop('jwt.encode', started)
+
+	return token
+
+
+
+class JWTTemplate:
+	"""Makes signed JWTs that only differ by their ``iat`` and ``exp`` claims.
+
+	The header segment and the constant claims are serialized once, so each token only has to format two integers
+	before encoding and signing the payload. Any ``iat`` or ``exp`` in ``claims`` take precedence over the values
+	passed to ``encode``.
+
+	Tokens are assembled in a scratch buffer shared between calls and templates, rather than by concatenating
+	intermediate strings, so refreshing doesn't scatter short-lived allocations across the heap.
+	"""
+
+	__slots__ = ('_signer', '_header_segment', '_claims_suffix', '_issued_at', '_expiry', '_signature_length')
+
+	_signer: BaseSigner
+
+	# The encoded header, including the trailing separator.
+	_header_segment: bytes
+
+	# The constant claims as JSON, minus the opening brace.
+	_claims_suffix: str
+
+	_issued_at: str | None
+	_expiry: str | None
+
+	# The length of the last signature, to size the scratch buffer up front.
+	_signature_length: int
+
+
+	def __init__ (self, signer: BaseSigner, claims: dict[str, str], header: dict[str, str] | None = None, key_id: str | None = None):
+		self._signer = signer
+
+		header = _make_header(signer, header, key_id)
+		self._header_segment = unpadded_urlsafe_b64encode(dump_json_string(header).encode('utf-8')) + b'.'
+
+		claims = dict(claims)
+
+		issued_at = claims.pop('iat', None)
+		self._issued_at = None if issued_at is None else dump_json_string(issued_at)
+
+		expiry = claims.pop('exp', None)
+		self._expiry = None if expiry is None else dump_json_string(expiry)
+
+		self._claims_suffix = ', ' + dump_json_string(claims)[1:] if claims else '}'
+
+		# A 2048-bit RSA signature, which is what service account keys have.
+		self._signature_length = 256
+
+
+	def encode (self, issued_at: int, expiry: int) -> bytes:
+		"""Make a signed JWT issued and expiring at the given UNIX timestamps."""
+
+		started = instrumentation.start()
+
+		payload = f'{{"iat": {self._issued_at or issued_at}, "exp": {self._expiry or expiry}{self._claims_suffix}'.encode('utf-8')
+
+		if _scratch_lock.acquire(0):
+			try:
+				token = self._assemble(_scratch, payload)
+
+			finally:
+				_scratch_lock.release()
+
+		else:
+			# Another thread has the scratch buffer.
+			token = self._assemble(bytearray(), payload)
+
+		instrumentation.stop('jwt.encode', started)
+
+		return token
+
+
+	def _assemble (self, scratch: bytearray, payload: bytes) -> bytes:
+		header_length = len(self._header_segment)
+		signing_input_length = header_length + encoded_length(len(payload))
+
+		if (shortfall := signing_input_length + 1 + encoded_length(self._signature_length) - len(scratch)) > 0:
+			scratch.extend(bytes(shortfall))
+
+		scratch[:header_length] = self._header_segment
+		encode_into(scratch, header_length, payload)
+
+		# Signers get bytes, which any implementation can hash or concatenate, rather than a view of the buffer. Views
+		# only live within an expression: one kept by a traceback would stop the buffer from ever being resized again.
+		signature = self._signer.sign(bytes(memoryview(scratch)[:signing_input_length]))
+
+		if len(signature) != self._signature_length:
+			self._signature_length = len(signature)
+
+			if (shortfall := signing_input_length + 1 + encoded_length(len(signature)) - len(scratch)) > 0:
+				scratch.extend(bytes(shortfall))
+
+		scratch[signing_input_length] = 0x2e  # .
+		end = encode_into(scratch, signing_input_length + 1, signature)
+
+		return bytes(memoryview(scratch)[:end])
@@ -0,0 +1,85 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous transport adapter for aiohttp, which micropython-lib also provides."""
+
+from asyncio import wait_for, TimeoutError as AsyncTimeoutError
+
+from aiohttp import ClientSession
+
+from google.auth.exceptions import TransportError
+from google.auth.transport.base import BaseResponse, AsyncBaseRequest
+
+
+
+class Response(BaseResponse):
+	"""A response whose body has already been read, so its properties don't need awaiting."""
+
+	__slots__ = ('_status_code', '_headers', '_content')
+
+	_status_code: int
+	_headers: dict
+	_content: bytes
+
+
+	def __init__ (self, status_code: int, headers: dict, content: bytes):
+		self._status_code = status_code
+		self._headers = headers
+		self._content = content
+
+
+	@property
+	def status_code (self) -> int:
+		return self._status_code
+
+
+	@property
+	def headers (self) -> dict:
+		return self._headers
+
+
+	@property
+	def content (self) -> bytes:
+		return self._content
+
+
+
+class Request(AsyncBaseRequest):
+	_session: ClientSession | None
+
+
+	def __init__ (self, session: ClientSession | None = None):
+		"""Uses ``session`` when given, otherwise each call opens and closes its own session."""
+
+		self._session = session
+
+
+	async def _request (self, session: ClientSession, url: str, method: str, body: str | bytes | None, headers: dict[str, str] | None, **kwargs) -> Response:
+		response = await session.request(method, url, data = body, headers = headers, **kwargs)
+		return Response(response.status, response.headers, await response.read())
+
+
+	async def __call__ (self, url: str, method: str = 'GET', body: str | bytes | None = None, headers: dict[str, str] | None = None, timeout: int | None = None, **kwargs) -> Response:
+		if timeout is None:
+			timeout = self._DEFAULT_TIMEOUT
+
+		try:
+			if self._session is not None:
+				return await wait_for(self._request(self._session, url, method, body, headers, **kwargs), timeout)
+
+			async with ClientSession() as session:
+				return await wait_for(self._request(session, url, method, body, headers, **kwargs), timeout)
+
+		except (OSError, ValueError, AsyncTimeoutError) as exc:
+			raise TransportError(exc) from exc
@@ -0,0 +1,146 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Transports that authorize every call with the credentials' token, refreshing it when needed.
+
+Wrap one long-lived transport, such as ``google.auth.transport.session.Request``, so API calls and token refreshes
+share its connections. Each call goes through the credentials' ``before_request``, so the token is only refreshed
+once it's no longer fresh, and the ``Authorization`` header is only rebuilt when the token changes. A call answered
+with one of ``refresh_status_codes`` is retried after refreshing the token.
+"""
+
+from google.auth.credentials.base import BaseCredentials
+from google.auth.transport import DEFAULT_REFRESH_STATUS_CODES, DEFAULT_MAX_REFRESH_ATTEMPTS
+from google.auth.transport.base import BaseRequest, AsyncBaseRequest, BaseResponse
+
+
+
+class _Authorization:
+	"""The refresh policy shared by both transports."""
+
+	DEFAULT_REFRESH_STATUS_CODES: tuple[int, ...] = DEFAULT_REFRESH_STATUS_CODES
+	DEFAULT_MAX_REFRESH_ATTEMPTS: int = DEFAULT_MAX_REFRESH_ATTEMPTS
+
+	_credentials: BaseCredentials
+	_refresh_status_codes: tuple[int, ...]
+	_max_refresh_attempts: int
+
+
+	def __init__ (self, credentials: BaseCredentials, refresh_status_codes: tuple[int, ...] | None = None, max_refresh_attempts: int | None = None):
+		self._credentials = credentials
+
+		if refresh_status_codes is None:
+			refresh_status_codes = self.DEFAULT_REFRESH_STATUS_CODES
+		self._refresh_status_codes = refresh_status_codes
+
+		if max_refresh_attempts is None:
+			max_refresh_attempts = self.DEFAULT_MAX_REFRESH_ATTEMPTS
+		self._max_refresh_attempts = max_refresh_attempts
+
+
+	@property
+	def credentials (self) -> BaseCredentials:
+		return self._credentials
+
+
+	@staticmethod
+	def _copy_headers (headers: dict[str, str] | None) -> dict[str, str]:
+		"""Copies ``headers`` minus any ``Authorization`` header, which the credentials provide."""
+
+		if not headers:
+			return {}
+
+		return {name: value for name, value in headers.items() if name.lower() != 'authorization'}
+
+
+	def _should_retry (self, response: BaseResponse, refreshes: int) -> bool:
+		return response.status_code in self._refresh_status_codes and refreshes < self._max_refresh_attempts
+
+
+
+class AuthorizedRequest(_Authorization, BaseRequest):
+	"""Authorizes calls made through ``request``, by default a connection-pooling session where one is available."""
+
+	_request: BaseRequest
+
+
+	def __init__ (self, credentials: BaseCredentials, request: BaseRequest | None = None, refresh_status_codes: tuple[int, ...] | None = None, max_refresh_attempts: int | None = None):
+		super().__init__(credentials, refresh_status_codes, max_refresh_attempts)
+
+		if request is None:
+			try:
+				from google.auth.transport.session import Request
+
+			except ImportError:
+				# MicroPython's requests has no sessions.
+				from google.auth.transport.requests import Request
+
+			request = Request()
+
+		self._request = request
+
+
+	def __call__ (self, url: str, method: str = 'GET', body: str | bytes | None = None, headers: dict[str, str] | None = None, timeout: int | None = None, **kwargs) -> BaseResponse:
+		credentials = self._credentials
+		refreshes = 0
+
+		while True:
+			request_headers = self._copy_headers(headers)
+			credentials.before_request(self._request, request_headers)
+			token = credentials.token
+
+			response = self._request(url, method, body, request_headers, timeout, **kwargs)
+
+			if not self._should_retry(response, refreshes):
+				return response
+
+			refreshes += 1
+
+			# Another call may have refreshed the token already, in which case retrying with the new one is enough.
+			if credentials.token is token:
+				credentials.refresh(self._request)
+
+
+
+class AsyncAuthorizedRequest(_Authorization, AsyncBaseRequest):
+	"""Like ``AuthorizedRequest``, for asynchronous transports."""
+
+	_request: AsyncBaseRequest
+
+
+	def __init__ (self, credentials: BaseCredentials, request: AsyncBaseRequest, refresh_status_codes: tuple[int, ...] | None = None, max_refresh_attempts: int | None = None):
+		super().__init__(credentials, refresh_status_codes, max_refresh_attempts)
+
+		self._request = request
+
+
+	async def __call__ (self, url: str, method: str = 'GET', body: str | bytes | None = None, headers: dict[str, str] | None = None, timeout: int | None = None, **kwargs) -> BaseResponse:
+		credentials = self._credentials
+		refreshes = 0
+
+		while True:
+			request_headers = self._copy_headers(headers)
+			await credentials.before_request_async(self._request, request_headers)
+			token = credentials.token
+
+			response = await self._request(url, method, body, request_headers, timeout, **kwargs)
+
+			if not self._should_retry(response, refreshes):
+				return response
+
+			refreshes += 1
+
+			# Another call may have refreshed the token already, in which case retrying with the new one is enough.
+			if credentials.token is token:
+				await credentials.refresh_async(self._request)
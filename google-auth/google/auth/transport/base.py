@@ -14,6 +14,9 @@
 
 
 class BaseResponse:
+	__slots__ = ()
+
+
 	@property
 	def status_code (self):
 		raise NotImplementedError("status must be implemented.")
@@ -36,3 +39,14 @@ class BaseRequest:
 
 	def __call__ (self, url: str, method: str = 'GET', body: str | bytes = None, headers: dict[str, str] | None = None, timeout: int | None = None, **kwargs) -> BaseResponse:
 		raise NotImplementedError("__call__ must be implemented.")
+
+
+
+class AsyncBaseRequest:
+	"""Like ``BaseRequest``, except calls return awaitables. Responses must have read their content before returning."""
+
+	_DEFAULT_TIMEOUT: int = 120
+
+
+	async def __call__ (self, url: str, method: str = 'GET', body: str | bytes = None, headers: dict[str, str] | None = None, timeout: int | None = None, **kwargs) -> BaseResponse:
+		raise NotImplementedError("__call__ must be implemented.")
@@ -22,6 +22,8 @@ from google.auth.transport.base import BaseResponse, BaseRequest
 
 
 class Response(BaseResponse):
+	__slots__ = ('_response',)
+
 	_response: RequestsResponse
 
 	def __init__ (self, response: RequestsResponse):
@@ -0,0 +1,126 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Connection-pooling transport adapter for Requests sessions.
+
+Unlike ``google.auth.transport.requests``, connections are kept alive between calls so repeated token requests skip
+the TCP and TLS handshakes. Sessions aren't available in MicroPython's requests, so this is CPython only.
+"""
+
+from _thread import allocate_lock
+from time import monotonic
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from google.auth.exceptions import TransportError
+from google.auth.transport.base import BaseRequest
+from google.auth.transport.requests import Response
+
+
+
+class Request(BaseRequest):
+	# Connections kept per host, and how many hosts to keep pools for.
+	DEFAULT_POOL_SIZE: int = 4
+	DEFAULT_POOL_HOSTS: int = 4
+
+	# Servers drop idle connections, so a session left unused this long is replaced rather than reused.
+	DEFAULT_MAX_IDLE_SECONDS: float = 60.0
+
+	_pool_size: int
+	_pool_hosts: int
+	_max_idle_seconds: float
+
+	_lock: object
+	_session: Session | None
+	_last_used: float
+	_in_flight: int
+
+
+	def __init__ (self, pool_size: int | None = None, pool_hosts: int | None = None, max_idle_seconds: float | None = None):
+		if pool_size is None:
+			pool_size = self.DEFAULT_POOL_SIZE
+		self._pool_size = pool_size
+
+		if pool_hosts is None:
+			pool_hosts = self.DEFAULT_POOL_HOSTS
+		self._pool_hosts = pool_hosts
+
+		if max_idle_seconds is None:
+			max_idle_seconds = self.DEFAULT_MAX_IDLE_SECONDS
+		self._max_idle_seconds = max_idle_seconds
+
+		self._lock = allocate_lock()
+		self._session = None
+		self._last_used = 0.0
+		self._in_flight = 0
+
+
+	def _new_session (self) -> Session:
+		session = Session()
+
+		# Blocking makes callers wait for a pooled connection instead of opening throwaway ones.
+		adapter = HTTPAdapter(pool_connections = self._pool_hosts, pool_maxsize = self._pool_size, pool_block = True)
+		session.mount('https://', adapter)
+		session.mount('http://', adapter)
+
+		return session
+
+
+	def _acquire_session (self) -> Session:
+		with self._lock:
+			now = monotonic()
+
+			if self._session is not None and not self._in_flight and now - self._last_used > self._max_idle_seconds:
+				self._session.close()
+				self._session = None
+
+			if self._session is None:
+				self._session = self._new_session()
+
+			self._last_used = now
+			self._in_flight += 1
+
+			return self._session
+
+
+	def _release_session (self) -> None:
+		with self._lock:
+			self._last_used = monotonic()
+			self._in_flight -= 1
+
+
+	def close (self) -> None:
+		"""Closes every pooled connection. The next call opens a new pool."""
+
+		with self._lock:
+			if self._session is not None:
+				self._session.close()
+				self._session = None
+
+
+	def __call__ (self, url: str, method: str = 'GET', body: str | bytes | None = None, headers: dict[str, str] | None = None, timeout: int | None = None, **kwargs) -> Response:
+		if timeout is None:
+			timeout = self._DEFAULT_TIMEOUT
+
+		session = self._acquire_session()
+
+		try:
+			return Response(session.request(method, url, data = body, headers = headers, timeout = timeout, **kwargs))
+
+		except ValueError as exc:
+			raise TransportError(exc) from exc
+
+		finally:
+			self._release_session()
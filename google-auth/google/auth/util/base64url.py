@@ -0,0 +1,77 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""URL-safe base64 without padding (RFC 4648, section 5), as used throughout JWTs.
+
+Both directions run through the native ``binascii`` codec, with the two alphabet differences swapped by
+``bytes.replace``. That keeps every pass over the data out of Python, on CPython and MicroPython alike.
+"""
+
+from binascii import a2b_base64, b2a_base64
+
+
+
+def encode (value: bytes | bytearray | memoryview) -> bytes:
+	"""Encodes ``value``, without padding."""
+
+	return b2a_base64(value).rstrip(b'\n=').replace(b'+', b'-').replace(b'/', b'_')
+
+
+
+def encoded_length (length: int) -> int:
+	"""The length of ``length`` bytes once encoded."""
+
+	return (length * 4 + 2) // 3
+
+
+
+def encode_into (buffer: bytearray, offset: int, value: bytes | bytearray | memoryview) -> int:
+	"""Encodes ``value`` into ``buffer`` at ``offset``, which must have room for it, and returns where it ends.
+
+	Only the native codec's output is allocated, rather than a copy per stripping and replacing step.
+	"""
+
+	encoded = b2a_base64(value)
+	length = encoded_length(len(value))
+
+	buffer[offset:offset + length] = memoryview(encoded)[:length]
+
+	# The alphabet differences are rare enough to patch one by one.
+	for old, new in ((b'+', 0x2d), (b'/', 0x5f)):
+		position = encoded.find(old)
+		while 0 <= position < length:
+			buffer[offset + position] = new
+			position = encoded.find(old, position + 1)
+
+	return offset + length
+
+
+
+def decode (value: str | bytes | bytearray) -> bytes:
+	"""Decodes ``value``, which may or may not be padded."""
+
+	if isinstance(value, str):
+		try:
+			value = value.encode('ascii')
+
+		except UnicodeError:
+			raise ValueError("string argument should contain only ASCII characters")
+
+	elif isinstance(value, bytearray):
+		value = bytes(value)
+
+	elif not isinstance(value, bytes):
+		raise TypeError(f"argument should be bytes or ASCII string, not {value.__class__.__name__}")
+
+	return a2b_base64(value.replace(b'-', b'+').replace(b'_', b'/') + b'=' * (-len(value) % 4))
@@ -15,13 +15,32 @@
 import random
 import time
 
+from google.auth.util.ticks import ticks_ms, ticks_add, ticks_diff
+from google.auth.util.retry_budget import RetryBudget
+from google.auth import instrumentation
+
 
 """Exponential Backoff Utility"""
 
 
 
 class ExponentialBackoff:
-	"""An exponential backoff iterator. This can be used in a for loop to perform requests with exponential backoff."""
+	"""An exponential backoff iterator. This can be used in a for loop to perform requests with exponential backoff.
+
+	With a deadline, iteration stops early once waiting for the next attempt would use up the rest of the budget, and
+	``clamp_timeout`` shortens each attempt's timeout to fit. The deadline runs from construction, or from the last call
+	to ``start``, which can also make retries draw on a shared ``RetryBudget``.
+	"""
+
+	__slots__ = ('_total_attempts', '_initial_wait_seconds', '_current_wait_seconds', '_randomization_factor', '_multiplier', '_jitter', '_backoff_count', '_sleep', '_deadline_ms', '_deadline', '_minimum_wait_seconds', '_retry_budget', 'budget_exhausted')
+
+	# Jitter strategies. Proportional varies each wait by the randomization factor either way. Full and equal jitter
+	# pick between no wait (or half the wait) and the whole wait, and decorrelated jitter picks between the initial wait
+	# and the multiplied previous wait.
+	JITTER_PROPORTIONAL: str = 'proportional'
+	JITTER_FULL: str = 'full'
+	JITTER_EQUAL: str = 'equal'
+	JITTER_DECORRELATED: str = 'decorrelated'
 
 	# The default amount of retry attempts
 	DEFAULT_RETRY_TOTAL_ATTEMPTS = 3
@@ -35,15 +54,36 @@ class ExponentialBackoff:
 	# The default multiplier value (2 which is 100% increase per back off).
 	DEFAULT_MULTIPLIER: float = 2.0
 
+	DEFAULT_JITTER: str = JITTER_PROPORTIONAL
+
+	# Rather than block for longer than this at a server's request, stop retrying.
+	MAX_DEFERRAL_SECONDS: float = 60.0
+
 	_total_attempts: int
 	_initial_wait_seconds: float
 	_current_wait_seconds: float
 	_randomization_factor: float
 	_multiplier: float
+	_jitter: str
 	_backoff_count: int
 
+	# Called with the number of seconds to wait between synchronous attempts.
+	_sleep: object
+
+	# The time budget, and the tick at which it runs out.
+	_deadline_ms: int | None
+	_deadline: int | None
+
+	# Set by a ``Retry-After`` header, for the next wait only.
+	_minimum_wait_seconds: float
 
-	def __init__ (self, total_attempts: int | None = None, initial_wait_seconds: int | None = None, randomization_factor: float | None = None, multiplier: float | None = None) -> None:
+	_retry_budget: RetryBudget | None
+
+	# Whether iteration stopped because the retry budget ran out.
+	budget_exhausted: bool
+
+
+	def __init__ (self, total_attempts: int | None = None, initial_wait_seconds: int | None = None, randomization_factor: float | None = None, multiplier: float | None = None, deadline_seconds: float | None = None, jitter: str | None = None, sleep = None) -> None:
 		if total_attempts is None:
 			total_attempts = self.DEFAULT_RETRY_TOTAL_ATTEMPTS
 
@@ -60,7 +100,51 @@ class ExponentialBackoff:
 			multiplier = self.DEFAULT_MULTIPLIER
 
 		self._multiplier = multiplier
+		if jitter is None:
+			jitter = self.DEFAULT_JITTER
+
+		if jitter not in (self.JITTER_PROPORTIONAL, self.JITTER_FULL, self.JITTER_EQUAL, self.JITTER_DECORRELATED):
+			raise ValueError(f"Unknown jitter strategy: {jitter}")
+
+		self._jitter = jitter
+
+		# Pass ``sleep`` to wait some other way, such as yielding to a scheduler.
+		if sleep is None:
+			sleep = time.sleep
+
+		self._sleep = sleep
+
+		self._deadline_ms = None if deadline_seconds is None else int(deadline_seconds * 1000)
+
+		self.start()
+
+
+	def start (self, retry_budget: RetryBudget | None = None) -> None:
+		"""Resets the attempt count and restarts the deadline, ahead of an operation's first attempt.
+
+		Each retry then spends a token from ``retry_budget``, if given, and iteration stops once it's exhausted.
+		"""
+
 		self._backoff_count = 0
+		self._current_wait_seconds = self._initial_wait_seconds
+		self._deadline = None if self._deadline_ms is None else ticks_add(ticks_ms(), self._deadline_ms)
+		self._minimum_wait_seconds = 0.0
+		self._retry_budget = retry_budget
+		self.budget_exhausted = False
+
+
+	def copy (self) -> 'ExponentialBackoff':
+		"""Returns a new backoff with the same settings, for an operation that may run alongside this one's."""
+
+		deadline_seconds = None if self._deadline_ms is None else self._deadline_ms / 1000
+
+		return type(self)(self._total_attempts, self._initial_wait_seconds, self._randomization_factor, self._multiplier, deadline_seconds, self._jitter, self._sleep)
+
+
+	def defer (self, seconds: float) -> None:
+		"""Makes the next wait last at least ``seconds``, as asked for by a ``Retry-After`` header."""
+
+		self._minimum_wait_seconds = seconds
 
 
 	def __iter__ (self) -> 'ExponentialBackoff':
@@ -71,24 +155,101 @@ class ExponentialBackoff:
 		return self
 
 
-	def __next__ (self) -> int:
+	def _jittered_wait (self) -> float:
+		wait = self._current_wait_seconds
+
+		if self._jitter == self.JITTER_DECORRELATED:
+			wait = random.uniform(self._initial_wait_seconds, wait * self._multiplier)
+			self._current_wait_seconds = wait
+			return wait
+
+		self._current_wait_seconds *= self._multiplier
+
+		if self._jitter == self.JITTER_FULL:
+			return random.uniform(0, wait)
+
+		if self._jitter == self.JITTER_EQUAL:
+			return wait / 2 + random.uniform(0, wait / 2)
+
+		jitter_variance: float = wait * self._randomization_factor
+		return random.uniform(wait - jitter_variance, wait + jitter_variance)
+
+
+	def _next_wait (self) -> float | None:
+		"""Counts an attempt and returns how long to wait before it, or ``None`` once attempts are exhausted."""
 
 		if self._backoff_count >= self._total_attempts:
-			raise StopIteration
+			return None
+
+		if self._minimum_wait_seconds > self.MAX_DEFERRAL_SECONDS:
+			return None
+
+		wait = max(self._jittered_wait(), self._minimum_wait_seconds)
+		self._minimum_wait_seconds = 0.0
+
+		# Don't wait for an attempt there'd be no time left to make.
+		if (remaining := self.remaining_seconds) is not None and wait >= remaining:
+			return None
+
+		if self._retry_budget is not None and not self._retry_budget.try_spend():
+			self.budget_exhausted = True
+			return None
 
 		self._backoff_count += 1
 
-		jitter_variance: float = self._current_wait_seconds * self._randomization_factor
-		jitter: float = random.uniform(self._current_wait_seconds - jitter_variance, self._current_wait_seconds + jitter_variance)
+		return wait
+
+
+	def __next__ (self) -> int:
+		if (wait := self._next_wait()) is None:
+			raise StopIteration
 
 		# Wait a bit
-		time.sleep(jitter)
+		started = instrumentation.start()
+		self._sleep(wait)
+		instrumentation.stop('backoff', started)
+
+		return self._backoff_count
+
+
+	def __aiter__ (self) -> 'ExponentialBackoff':
+		return self.__iter__()
 
-		self._current_wait_seconds *= self._multiplier
+
+	async def __anext__ (self) -> int:
+		# Only loaded by asynchronous callers.
+		from asyncio import sleep
+
+		if (wait := self._next_wait()) is None:
+			raise StopAsyncIteration
+
+		# Wait a bit, letting other tasks run meanwhile
+		started = instrumentation.start()
+		await sleep(wait)
+		instrumentation.stop('backoff', started)
 
 		return self._backoff_count
 
 
+	@property
+	def remaining_seconds (self) -> float | None:
+		"""The time left before the deadline, or ``None`` without one."""
+
+		if self._deadline is None:
+			return None
+
+		return max(0, ticks_diff(self._deadline, ticks_ms())) / 1000
+
+
+	def clamp_timeout (self, timeout: float) -> float:
+		"""Shortens ``timeout`` so an attempt can't run past the deadline."""
+
+		if (remaining := self.remaining_seconds) is None:
+			return timeout
+
+		return min(timeout, remaining)
+
+
 	@property
 	def total_attempts (self) -> int:
 		"""The total number of backoff attempts that can be made."""
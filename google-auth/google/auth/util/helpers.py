@@ -15,7 +15,8 @@
 """Helper functions for commonly used utilities."""
 
 from datetime import datetime, timezone
-from base64 import b64encode, b64decode
+
+from google.auth.util import base64url
 
 
 
@@ -48,55 +49,14 @@ def from_bytes (value: str | bytes, encoding: str = 'utf-8') -> str:
 
 
 
-def _b64_translate (input_bytes, trans_table):
-	"""Re-implement bytes.translate() as there is no such function in micropython"""
-	result = bytearray()
-
-	for byte in input_bytes:
-		translated_byte = trans_table.get(byte, byte)
-		result.append(translated_byte)
-
-	return bytes(result)
-
-
-
-def _b64_maketrans (f, t):
-	"""Re-implement bytes.maketrans() as there is no such function in micropython"""
-	if len(f) != len(t):
-		raise ValueError("maketrans arguments must have same length")
-	translation_table = dict(zip(f, t))
-	return translation_table
-
-
-
-def _b64_bytes_from_decode_data (s):
-	if isinstance(s, str):
-		try:
-			return s.encode("ascii")
-		except UnicodeEncodeError:
-			raise ValueError("string argument should contain only ASCII characters")
-	elif isinstance(s, (bytes, bytearray)):
-		return s
-	else:
-		raise TypeError("argument should be bytes or ASCII string, not %s" % s.__class__.__name__)
-
-
-
-_urlsafe_encode_translation = _b64_maketrans(b'+/', b'-_')
-_urlsafe_decode_translation = _b64_maketrans(b'-_', b'+/')
-
-
-
-def unpadded_urlsafe_b64encode (value: bytes | str) -> bytes | str:
+def unpadded_urlsafe_b64encode (value: bytes) -> bytes:
 	"""Encodes base64 strings removing any padding characters."""
 
-	return _b64_translate(b64encode(value), _urlsafe_encode_translation).rstrip(b'=')
+	return base64url.encode(value)
 
 
 
 def padded_urlsafe_b64decode (value: str | bytes) -> bytes:
 	"""Decodes base64 strings lacking padding characters."""
 
-	value: bytes = to_bytes(value)
-	value = value + b'=' * (-len(value) % 4)
-	return b64decode(_b64_translate(_b64_bytes_from_decode_data(value), _urlsafe_decode_translation))
+	return base64url.decode(value)
@@ -0,0 +1,67 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""``allocate_lock`` from ``_thread``, or a stand-in on MicroPython ports built without threads, such as the ESP8266."""
+
+try:
+	from _thread import allocate_lock
+
+except ImportError:
+
+	class _Lock:
+		"""Tracks whether it's held, like a real lock, but never waits, since there are no other threads to wait for."""
+
+		__slots__ = ('_locked',)
+
+		_locked: bool
+
+
+		def __init__ (self):
+			self._locked = False
+
+
+		def acquire (self, blocking: bool = True, timeout: float = -1) -> bool:
+			if self._locked:
+				if blocking:
+					# Nothing could ever release it.
+					raise RuntimeError("Deadlock acquiring a lock that's already held.")
+
+				return False
+
+			self._locked = True
+			return True
+
+
+		def release (self) -> None:
+			if not self._locked:
+				raise RuntimeError("Releasing a lock that isn't held.")
+
+			self._locked = False
+
+
+		def locked (self) -> bool:
+			return self._locked
+
+
+		def __enter__ (self) -> bool:
+			return self.acquire()
+
+
+		def __exit__ (self, *args) -> None:
+			self.release()
+
+
+
+	def allocate_lock () -> _Lock:
+		return _Lock()
@@ -0,0 +1,81 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A token bucket limiting how many retries the whole process makes."""
+
+from google.auth.util.locks import allocate_lock
+from google.auth.util.ticks import ticks_ms, ticks_diff
+
+
+
+class RetryBudget:
+	"""Each retry spends a token, and spent tokens trickle back at a fixed rate.
+
+	Retries stop once the bucket runs dry, so a struggling endpoint sees roughly ``refill_per_second`` retries per
+	second from the process however many credentials are refreshing.
+	"""
+
+	DEFAULT_CAPACITY: float = 10.0
+	DEFAULT_REFILL_PER_SECOND: float = 0.5
+
+	_capacity: float
+	_refill_per_ms: float
+	_tokens: float
+	_refilled_at: int
+	_lock: object
+
+
+	def __init__ (self, capacity: float | None = None, refill_per_second: float | None = None):
+		if capacity is None:
+			capacity = self.DEFAULT_CAPACITY
+		self._capacity = capacity
+
+		if refill_per_second is None:
+			refill_per_second = self.DEFAULT_REFILL_PER_SECOND
+		self._refill_per_ms = refill_per_second / 1000
+
+		self._tokens = capacity
+		self._refilled_at = ticks_ms()
+		self._lock = allocate_lock()
+
+
+	def _refill (self) -> None:
+		now = ticks_ms()
+		self._tokens = min(self._capacity, self._tokens + ticks_diff(now, self._refilled_at) * self._refill_per_ms)
+		self._refilled_at = now
+
+
+	def try_spend (self) -> bool:
+		"""Takes a token for one retry, or returns ``False`` if the budget is exhausted."""
+
+		with self._lock:
+			self._refill()
+
+			if self._tokens < 1:
+				return False
+
+			self._tokens -= 1
+			return True
+
+
+	@property
+	def available (self) -> float:
+		with self._lock:
+			self._refill()
+			return self._tokens
+
+
+
+# Shared by every token request that doesn't specify its own budget.
+DEFAULT_RETRY_BUDGET: RetryBudget = RetryBudget()
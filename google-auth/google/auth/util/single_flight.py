@@ -0,0 +1,118 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Coalesces concurrent calls sharing a key into a single call."""
+
+from google.auth.util.locks import allocate_lock
+
+
+
+class _Call:
+	# Held until the call finishes.
+	done: object
+
+	result: object
+	error: BaseException | None
+
+
+	def __init__ (self, done: object):
+		self.done = done
+		self.result = None
+		self.error = None
+
+
+
+class SingleFlight:
+	"""Runs one call per key at a time for threaded callers. Anyone calling while it's in flight waits and shares its result or error."""
+
+	_lock: object
+	_calls: dict[object, _Call]
+
+
+	def __init__ (self):
+		self._lock = allocate_lock()
+		self._calls = {}
+
+
+	def do (self, key: object, function, *args) -> object:
+		with self._lock:
+			call = self._calls.get(key)
+
+			if leader := call is None:
+				done = allocate_lock()
+				done.acquire()
+
+				call = self._calls[key] = _Call(done)
+
+		if not leader:
+			# Block until the leader releases it.
+			with call.done:
+				pass
+
+			if call.error is not None:
+				raise call.error
+
+			return call.result
+
+		try:
+			call.result = function(*args)
+			return call.result
+
+		except BaseException as exc:
+			call.error = exc
+			raise
+
+		finally:
+			with self._lock:
+				del self._calls[key]
+
+			call.done.release()
+
+
+
+class AsyncSingleFlight:
+	"""Like ``SingleFlight``, for coroutines running on a single event loop."""
+
+	_calls: dict[object, _Call]
+
+
+	def __init__ (self):
+		self._calls = {}
+
+
+	async def do (self, key: object, function, *args) -> object:
+		if (call := self._calls.get(key)) is not None:
+			await call.done.wait()
+
+			if call.error is not None:
+				raise call.error
+
+			return call.result
+
+		# Only loaded by asynchronous callers.
+		from asyncio import Event
+
+		call = self._calls[key] = _Call(Event())
+
+		try:
+			call.result = await function(*args)
+			return call.result
+
+		except BaseException as exc:
+			call.error = exc
+			raise
+
+		finally:
+			del self._calls[key]
+			call.done.set()
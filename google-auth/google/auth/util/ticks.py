@@ -0,0 +1,45 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Monotonic clock readings in whole micro- and milliseconds.
+
+MicroPython's ``time.ticks_*`` functions wrap around, so differences must always be taken with ``ticks_diff``.
+"""
+
+import time
+
+
+try:
+	ticks_us = time.ticks_us
+	ticks_ms = time.ticks_ms
+	ticks_add = time.ticks_add
+	ticks_diff = time.ticks_diff
+
+except AttributeError:
+	# CPython's clock doesn't wrap, so plain integer arithmetic will do.
+
+	def ticks_us () -> int:
+		return time.monotonic_ns() // 1_000
+
+
+	def ticks_ms () -> int:
+		return time.monotonic_ns() // 1_000_000
+
+
+	def ticks_add (ticks: int, delta: int) -> int:
+		return ticks + delta
+
+
+	def ticks_diff (end: int, start: int) -> int:
+		return end - start
@@ -1,4 +1,4 @@
-__all__ = 'urlencode'
+__all__ = ('urlencode', 'quote_into')
 
 # noinspection SpellCheckingInspection
 _ALWAYS_SAFE: bytes = (
@@ -10,46 +10,80 @@ _ALWAYS_SAFE: bytes = (
 
 
 
-def _encode_bytes (string: bytes, safe: bytes) -> str:
-	for char in string:
-		if char in safe:
-			yield chr(char)
+def _make_escape_table (safe: bytes) -> tuple[bytes, ...]:
+	"""Maps every byte value to its form encoding."""
+
+	table: list[bytes] = []
+
+	for byte in range(256):
+		if byte == 0x20:
+			table.append(b'+')
+
+		elif byte in safe:
+			table.append(bytes((byte,)))
+
 		else:
-			yield f'%{char:02X}'
+			table.append(f'%{byte:02X}'.encode('ascii'))
 
+	return tuple(table)
 
 
-def _quote (string: str | bytes, safe: str = '', encoding: str = 'utf-8') -> str:
-	if isinstance(string, str):
-		string: bytes = string.encode(encoding)
 
+# Escape tables by their extra safe characters, the default one is built up front.
+_escape_tables: dict[bytes, tuple[bytes, ...]] = {b'': _make_escape_table(_ALWAYS_SAFE)}
+
+
+
+def _escape_table (safe: str | bytes) -> tuple[bytes, ...]:
 	if isinstance(safe, str):
-		safe += ' '
 		# Normalize 'safe' by converting to bytes and removing non-ASCII chars
 		safe: bytes = safe.encode('ascii', 'ignore')
 	else:
-		safe += b' '
 		safe: bytes = bytes([c for c in safe if c < 128])
-	safe += _ALWAYS_SAFE
 
-	return (''.join(_encode_bytes(string, safe))).replace(' ', '+')
+	if (table := _escape_tables.get(safe)) is None:
+		table = _escape_tables[safe] = _make_escape_table(safe + _ALWAYS_SAFE)
+
+	return table
+
+
+
+def quote_into (buffer: bytearray, string: str | bytes, safe: str | bytes = '', encoding: str = 'utf-8') -> None:
+	"""Appends the form encoding of ``string`` to ``buffer``."""
+
+	if isinstance(string, str):
+		string: bytes = string.encode(encoding)
+
+	table = _escape_table(safe)
+
+	for byte in string:
+		buffer += table[byte]
+
+
+
+def _quote (string: str | bytes, safe: str = '', encoding: str = 'utf-8') -> str:
+	buffer = bytearray()
+	quote_into(buffer, string, safe, encoding)
+
+	return str(buffer, 'ascii')
 
 
 
 def urlencode (query: dict[str | bytes, str | bytes], safe: str | bytes = '', encoding: str = 'utf-8') -> str:
-	queries: list = []
+	buffer = bytearray()
 
 	for k, v in query.items():
-		if isinstance(k, bytes):
-			k = _quote(k, safe)
-		else:
-			k = _quote(str(k), safe, encoding)
+		if buffer:
+			buffer += b'&'
 
-		if isinstance(v, bytes):
-			v = _quote(v, safe)
-		else:
-			v = _quote(str(v), safe, encoding)
+		if not isinstance(k, bytes):
+			k = str(k)
+		quote_into(buffer, k, safe, encoding)
+
+		buffer += b'='
 
-		queries.append(f'{k}={v}')
+		if not isinstance(v, bytes):
+			v = str(v)
+		quote_into(buffer, v, safe, encoding)
 
-	return '&'.join(queries)
+	return str(buffer, 'ascii')
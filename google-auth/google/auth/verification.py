@@ -0,0 +1,240 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Verifies RS256 signed JWTs, such as Google ID tokens, against the public keys in a JWKS document (RFC 7517).
+
+The document is fetched on first use and its keys parsed once, then kept by key ID for as long as the response's
+``Cache-Control: max-age`` allows. Keys are rotated in before tokens are signed with them, so a token from an unknown
+key also has the document fetched again, though no more often than ``MIN_REFETCH_INTERVAL_SECONDS``.
+"""
+
+from json import loads as load_json_string
+from time import time
+
+from google.auth.util.locks import allocate_lock
+from google.auth.crypt.rsa import RSAVerifier
+from google.auth.exceptions import InvalidValue, MalformedError, TransportError
+from google.auth.transport import DEFAULT_RETRYABLE_STATUS_CODES
+from google.auth.transport.base import BaseRequest, BaseResponse
+from google.auth.util.helpers import from_bytes, padded_urlsafe_b64decode, to_bytes, utcnow
+from google.auth.util.ticks import ticks_ms, ticks_add, ticks_diff
+
+
+GOOGLE_OAUTH2_CERTS_URL: str = 'https://www.googleapis.com/oauth2/v3/certs'
+GOOGLE_ISSUERS: tuple[str, ...] = ('accounts.google.com', 'https://accounts.google.com')
+
+# How far the issuer's clock may be from this one.
+DEFAULT_CLOCK_SKEW_SECONDS: int = 10
+
+
+
+def _max_age (response: BaseResponse) -> int | None:
+	"""The seconds the response may be cached for according to its ``Cache-Control`` header, or ``None`` without one."""
+
+	if not (headers := response.headers):
+		return None
+
+	if not (value := headers.get('Cache-Control') or headers.get('cache-control')):
+		return None
+
+	max_age = None
+	for directive in value.split(','):
+		name, _, argument = directive.strip().partition('=')
+		name = name.lower()
+
+		if name in ('no-cache', 'no-store'):
+			return 0
+
+		if name == 'max-age':
+			try:
+				max_age = max(0, int(argument.strip('"')))
+
+			except ValueError:
+				pass
+
+	return max_age
+
+
+
+class KeySet:
+	"""The public keys published at ``url``, by key ID."""
+
+	__slots__ = ('_url', '_verifiers', '_fetched_at', '_expires_at', '_wall_expires_at', '_lock')
+
+	# For responses that don't say how long they can be cached.
+	DEFAULT_MAX_AGE_SECONDS: int = 300
+
+	# MicroPython's tick counters only compare reliably over a few days.
+	MAX_AGE_LIMIT_SECONDS: int = 24 * 60 * 60
+
+	MIN_REFETCH_INTERVAL_SECONDS: int = 60
+
+	_url: str
+	_verifiers: dict[str | None, RSAVerifier]
+
+	# In ``ticks_ms``, or ``None`` before the first fetch.
+	_fetched_at: int | None
+	_expires_at: int | None
+
+	# In ``time()`` seconds. Ticks can't tell a key set idle for a whole period from a fresh one, so the keys are
+	# only kept while both clocks agree they're current.
+	_wall_expires_at: int | None
+
+	_lock: object
+
+
+	def __init__ (self, url: str | None = None):
+		if url is None:
+			url = GOOGLE_OAUTH2_CERTS_URL
+		self._url = url
+
+		self._verifiers = {}
+		self._fetched_at = None
+		self._expires_at = None
+		self._wall_expires_at = None
+
+		self._lock = allocate_lock()
+
+
+	def get (self, key_id: str | None, request: BaseRequest) -> RSAVerifier | None:
+		"""Returns the verifier for the key ``key_id``, fetching the keys first if needed, or ``None`` if there's no such key."""
+
+		fetched_at = self._fetched_at
+		now = ticks_ms()
+
+		# Once the ticks have wrapped since the fetch, the age reads as negative or as older than the max age.
+		if fetched_at is None or not 0 <= ticks_diff(now, fetched_at) < ticks_diff(self._expires_at, fetched_at) or time() >= self._wall_expires_at:
+			self._fetch(request, fetched_at)
+
+		elif key_id not in self._verifiers and ticks_diff(now, fetched_at) >= self.MIN_REFETCH_INTERVAL_SECONDS * 1000:
+			self._fetch(request, fetched_at)
+
+		return self._verifiers.get(key_id)
+
+
+	def _fetch (self, request: BaseRequest, fetched_at: int | None) -> None:
+		with self._lock:
+			# Another thread fetched the keys while this one waited for the lock.
+			if self._fetched_at != fetched_at:
+				return
+
+			response = request(self._url, method = 'GET')
+
+			if response.status_code != 200:
+				raise TransportError(f"Could not fetch public keys from {self._url}, status {response.status_code}.", retryable = response.status_code in DEFAULT_RETRYABLE_STATUS_CODES)
+
+			try:
+				keys: list[dict[str, str]] = load_json_string(from_bytes(response.content))['keys']
+
+			except (ValueError, KeyError, TypeError):
+				raise MalformedError(f"The public keys at {self._url} are not a JWKS document.")
+
+			# Only signing keys for RS256 are of use, but the document may well list others.
+			verifiers: dict[str | None, RSAVerifier] = {}
+			for jwk in keys:
+				if jwk.get('kty') == 'RSA' and jwk.get('alg', 'RS256') == 'RS256' and jwk.get('use', 'sig') == 'sig':
+					verifiers[jwk.get('kid')] = RSAVerifier.from_jwk(jwk)
+
+			max_age = _max_age(response)
+			if max_age is None:
+				max_age = self.DEFAULT_MAX_AGE_SECONDS
+
+			max_age = min(max_age, self.MAX_AGE_LIMIT_SECONDS)
+			now = ticks_ms()
+
+			self._verifiers = verifiers
+			self._expires_at = ticks_add(now, max_age * 1000)
+			self._wall_expires_at = int(time()) + max_age
+			self._fetched_at = now
+
+
+# Google's OAuth 2.0 keys, shared by every caller of ``verify_oauth2_token``.
+DEFAULT_KEY_SET: KeySet = KeySet()
+
+
+
+def verify_token (token: str | bytes, request: BaseRequest, key_set: KeySet, audience: str | list[str] | None = None, issuers: tuple[str, ...] | None = None, clock_skew_seconds: int | None = None) -> dict:
+	"""Checks ``token``'s signature against ``key_set`` and its claims against the arguments, and returns its claims.
+
+	The token must have an ``exp`` claim, and mustn't be used before any ``nbf`` claim. Both allow for
+	``clock_skew_seconds``. Its audience and issuer are only checked when ``audience`` and ``issuers`` are given.
+	"""
+
+	if clock_skew_seconds is None:
+		clock_skew_seconds = DEFAULT_CLOCK_SKEW_SECONDS
+
+	token = to_bytes(token)
+
+	try:
+		signing_input_length = token.rindex(b'.')
+		header_segment, payload_segment = token[:signing_input_length].split(b'.')
+
+		header: dict = load_json_string(from_bytes(padded_urlsafe_b64decode(header_segment)))
+		payload: dict = load_json_string(from_bytes(padded_urlsafe_b64decode(payload_segment)))
+		signature = padded_urlsafe_b64decode(token[signing_input_length + 1:])
+
+	except ValueError:
+		raise MalformedError("The token is not a JWT.")
+
+	if not isinstance(header, dict) or not isinstance(payload, dict):
+		raise MalformedError("The token is not a JWT.")
+
+	if (algorithm := header.get('alg')) != 'RS256':
+		raise InvalidValue(f"Tokens signed with {algorithm} are not supported.")
+
+	# Used as a dictionary key, so anything else could escape as a TypeError.
+	if not isinstance(key_id := header.get('kid'), (str, type(None))):
+		raise MalformedError("The token's key ID is not a string.")
+
+	if (verifier := key_set.get(key_id, request)) is None:
+		raise InvalidValue(f"The token was signed with an unknown key {key_id}.")
+
+	if not verifier.verify(token[:signing_input_length], signature):
+		raise InvalidValue("The token's signature is invalid.")
+
+	now = int(utcnow().timestamp())
+
+	if not isinstance(expiry := payload.get('exp'), (int, float)):
+		raise InvalidValue("The token has no expiry.")
+
+	if now - clock_skew_seconds >= expiry:
+		raise InvalidValue(f"The token expired at {expiry}, it's now {now}.")
+
+	if (not_before := payload.get('nbf')) is not None and (not isinstance(not_before, (int, float)) or now + clock_skew_seconds < not_before):
+		raise InvalidValue(f"The token isn't valid until {not_before}, it's now {now}.")
+
+	if isinstance(issued_at := payload.get('iat'), (int, float)) and now + clock_skew_seconds < issued_at:
+		raise InvalidValue(f"The token was issued in the future, at {issued_at}, it's now {now}.")
+
+	if audience is not None:
+		audiences = [audience] if isinstance(audience, str) else audience
+
+		claimed = payload.get('aud')
+		if not isinstance(claimed, list):
+			claimed = [claimed]
+
+		if not any(i in audiences for i in claimed):
+			raise InvalidValue(f"The token's audience {payload.get('aud')} isn't one of {', '.join(audiences)}.")
+
+	if issuers is not None and payload.get('iss') not in issuers:
+		raise InvalidValue(f"The token's issuer {payload.get('iss')} isn't one of {', '.join(issuers)}.")
+
+	return payload
+
+
+
+def verify_oauth2_token (token: str | bytes, request: BaseRequest, audience: str | list[str] | None = None, clock_skew_seconds: int | None = None) -> dict:
+	"""Verifies an ID token issued by Google, for ``audience`` (the client ID) if given, and returns its claims."""
+
+	return verify_token(token, request, DEFAULT_KEY_SET, audience, GOOGLE_ISSUERS, clock_skew_seconds)
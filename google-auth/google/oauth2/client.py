@@ -13,15 +13,16 @@
 # limitations under the License.
 
 from json import loads as load_json_string, dumps as dump_json_string
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from google.auth.util.exponential_backoff import ExponentialBackoff
+from google.auth.util.retry_budget import RetryBudget, DEFAULT_RETRY_BUDGET
 from google.auth.util.helpers import utcnow
 from google.auth.exceptions import RefreshError, MalformedError
 from google.auth.transport import DEFAULT_RETRYABLE_STATUS_CODES
-from google.auth.util.helpers import from_bytes
+from google.auth.util.helpers import from_bytes, to_bytes
 from google.auth.util.urlencode import urlencode
-from google.auth import metrics
+from google.auth import metrics, instrumentation
 
 from google.auth.transport.base import BaseRequest, BaseResponse
 
@@ -30,9 +31,16 @@ JSON_CONTENT_TYPE: str = 'application/json'
 URLENCODED_CONTENT_TYPE: str = 'application/x-www-form-urlencoded'
 JWT_GRANT_TYPE: str = 'urn:ietf:params:oauth:grant-type:jwt-bearer'
 
+_HTTP_DATE_MONTHS: tuple[str, ...] = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# The form encoded body of a JWT grant up to the assertion, which is the only part that varies.
+_JWT_GRANT_BODY_PREFIX: bytes = urlencode({'grant_type': JWT_GRANT_TYPE}).encode('utf-8') + b'&assertion='
+
 
 
 def _handle_error_response (response_data: str | dict[str, str], retryable_error: bool) -> None:
+	instrumentation.increment('token_request.failure')
+
 	if isinstance(response_data, str):
 		raise RefreshError(response_data, retryable = retryable_error)
 
@@ -47,6 +55,43 @@ def _handle_error_response (response_data: str | dict[str, str], retryable_error
 
 
 
+def _handle_exhausted_retry_budget (response_data: str | dict[str, str]) -> None:
+	instrumentation.increment('token_request.failure')
+	instrumentation.increment('token_request.budget_exhausted')
+
+	# Still retryable, just not by this process right now.
+	raise RefreshError("Not retrying the token request, the retry budget is exhausted.", response_data, retryable = True)
+
+
+
+def _retry_after (response: BaseResponse) -> float | None:
+	"""The seconds to wait according to the response's ``Retry-After`` header, or ``None`` without a usable one."""
+
+	if not (headers := response.headers):
+		return None
+
+	if (value := headers.get('Retry-After') or headers.get('retry-after')) is None:
+		return None
+
+	try:
+		return max(0.0, float(value))
+
+	except ValueError:
+		pass
+
+	# Otherwise it's an HTTP date, e.g. ``Wed, 21 Oct 2015 07:28:00 GMT``
+	try:
+		_, day, month, year, clock, _ = value.split()
+		hour, minute, second = clock.split(':')
+		when = datetime(int(year), _HTTP_DATE_MONTHS.index(month) + 1, int(day), int(hour), int(minute), int(second), tzinfo = timezone.utc)
+
+	except ValueError:
+		return None
+
+	return max(0.0, (when - utcnow()).total_seconds())
+
+
+
 def _can_retry (status_code: int, response_data: str | dict[str, str]) -> bool:
 	if status_code in DEFAULT_RETRYABLE_STATUS_CODES:
 		return True
@@ -68,11 +113,16 @@ def _can_retry (status_code: int, response_data: str | dict[str, str]) -> bool:
 
 
 
-def _token_endpoint_request (request: BaseRequest, token_uri: str, body: dict[str, str | bytes], access_token: str | None = None, use_json: bool = False, can_retry: bool = True, headers: dict[str, str] = None, **kwargs) -> dict[str, str]:
+def _prepare_request (body: dict[str, str | bytes] | bytes, access_token: str | None, use_json: bool, headers: dict[str, str] | None) -> tuple[dict[str, str], bytes]:
 	request_headers: dict[str, str] = {}
 	request_body: bytes = b''
 
-	if use_json:
+	if isinstance(body, bytes):
+		# Already encoded by the caller
+		request_headers['Content-Type'] = JSON_CONTENT_TYPE if use_json else URLENCODED_CONTENT_TYPE
+		request_body = body
+
+	elif use_json:
 		request_headers['Content-Type'] = JSON_CONTENT_TYPE
 		request_body = dump_json_string(body).encode('utf-8')
 
@@ -86,25 +136,53 @@ def _token_endpoint_request (request: BaseRequest, token_uri: str, body: dict[st
 	if headers:
 		request_headers.update(headers)
 
+	return request_headers, request_body
 
-	def _perform_request () -> tuple[bool, str | bytes | dict, bool | None]:
-		response: BaseResponse = request(method = 'POST', url = token_uri, headers = request_headers, body = request_body, **kwargs)
 
-		# Convert bytes to str
-		response_body: str | dict[str, str] = from_bytes(response.content)
 
-		try:
-			# The response should be JSON
-			response_body = load_json_string(response_body)
+def _parse_response (response: BaseResponse) -> tuple[bool, str | bytes | dict, bool | None]:
+	started = instrumentation.start()
+
+	# Convert bytes to str
+	response_body: str | dict[str, str] = from_bytes(response.content)
+
+	try:
+		# The response should be JSON
+		response_body = load_json_string(response_body)
+
+	except ValueError:
+		# No problem, keep it as a string
+		pass
+
+	instrumentation.stop('parse', started)
+
+	if response.status_code == 200:
+		return True, response_body, None
+
+	return False, response_body, _can_retry(status_code = response.status_code, response_data = response_body)
+
+
+
+def _token_endpoint_request (request: BaseRequest, token_uri: str, body: dict[str, str | bytes] | bytes, access_token: str | None = None, use_json: bool = False, can_retry: bool = True, headers: dict[str, str] = None, retry: ExponentialBackoff | None = None, retry_budget: RetryBudget | None = DEFAULT_RETRY_BUDGET, **kwargs) -> dict[str, str]:
+	request_headers, request_body = _prepare_request(body, access_token, use_json, headers)
+
+	# A copy, since the caller's may be configuring other requests running at the same time.
+	retry = ExponentialBackoff() if retry is None else retry.copy()
+
+	# The deadline covers every attempt, and the waits between them. Retries also draw on the process-wide budget.
+	retry.start(retry_budget)
+	timeout = kwargs.pop('timeout', None) or request._DEFAULT_TIMEOUT
+
 
-		except ValueError:
-			# No problem, keep it as a string
-			pass
+	def _perform_request () -> tuple[bool, str | bytes | dict, bool | None]:
+		started = instrumentation.start()
+		response = request(method = 'POST', url = token_uri, headers = request_headers, body = request_body, timeout = retry.clamp_timeout(timeout), **kwargs)
+		instrumentation.stop('http', started)
 
-		if response.status_code == 200:
-			return True, response_body, None
+		if response.status_code != 200 and (delay := _retry_after(response)) is not None:
+			retry.defer(delay)
 
-		return False, response_body, _can_retry(status_code = response.status_code, response_data = response_body)
+		return _parse_response(response)
 
 
 	request_succeeded: bool
@@ -123,8 +201,8 @@ def _token_endpoint_request (request: BaseRequest, token_uri: str, body: dict[st
 		return response_data
 
 	# Keep trying
-	retries = ExponentialBackoff()
-	for _ in retries:
+	for _ in retry:
+		instrumentation.increment('token_request.retry')
 		request_succeeded, response_data, retryable_error = _perform_request()
 
 		if request_succeeded:
@@ -134,18 +212,25 @@ def _token_endpoint_request (request: BaseRequest, token_uri: str, body: dict[st
 			_handle_error_response(response_data, retryable_error)
 			return response_data
 
+	if retry.budget_exhausted:
+		_handle_exhausted_retry_budget(response_data)
+
 	_handle_error_response(response_data, retryable_error)
 	return response_data
 
 
 
-def jwt_grant (request: BaseRequest, token_uri: str, assertion: bytes, can_retry: bool = True) -> tuple[str, datetime, dict[str, str]]:
-	body: dict[str, str | bytes] = {'assertion': assertion, 'grant_type': JWT_GRANT_TYPE}
+def _jwt_grant_request (assertion: bytes) -> tuple[bytes, dict[str, str]]:
+	# A JWT only contains base64url characters and dots, which form encoding leaves as they are.
+	body: bytes = _JWT_GRANT_BODY_PREFIX + to_bytes(assertion)
 
 	headers: dict[str, str] = {metrics.API_CLIENT_HEADER: metrics.token_request_access_token_sa_assertion()}
 
-	response_data: dict[str, str] = _token_endpoint_request(request, token_uri, body, can_retry = can_retry, headers = headers)
+	return body, headers
+
 
+
+def _parse_jwt_grant_response (response_data: dict[str, str]) -> tuple[str, datetime, dict[str, str]]:
 	try:
 		access_token = response_data['access_token']
 
@@ -167,3 +252,21 @@ def jwt_grant (request: BaseRequest, token_uri: str, assertion: bytes, can_retry
 		pass
 
 	return access_token, expiry, response_data
+
+
+
+def jwt_grant (request: BaseRequest, token_uri: str, assertion: bytes, can_retry: bool = True, retry: ExponentialBackoff | None = None) -> tuple[str, datetime, dict[str, str]]:
+	"""Exchanges a signed assertion for an access token. Pass ``retry`` to change how, and for how long, it retries.
+
+	``retry`` only provides the settings. Each request retries with its own copy, so one instance can be shared.
+	"""
+
+	body, headers = _jwt_grant_request(assertion)
+
+	started = instrumentation.start()
+	try:
+		response_data: dict[str, str] = _token_endpoint_request(request, token_uri, body, can_retry = can_retry, headers = headers, retry = retry)
+	finally:
+		instrumentation.stop('token_request', started)
+
+	return _parse_jwt_grant_response(response_data)
@@ -0,0 +1,99 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous counterparts of the token endpoint calls in ``google.oauth2.client``."""
+
+from datetime import datetime
+
+from google.auth.util.exponential_backoff import ExponentialBackoff
+from google.auth.util.retry_budget import RetryBudget, DEFAULT_RETRY_BUDGET
+from google.oauth2.client import _handle_error_response, _handle_exhausted_retry_budget, _retry_after, _prepare_request, _parse_response, _jwt_grant_request, _parse_jwt_grant_response
+
+from google.auth.transport.base import AsyncBaseRequest
+from google.auth import instrumentation
+
+
+
+async def _token_endpoint_request (request: AsyncBaseRequest, token_uri: str, body: dict[str, str | bytes] | bytes, access_token: str | None = None, use_json: bool = False, can_retry: bool = True, headers: dict[str, str] = None, retry: ExponentialBackoff | None = None, retry_budget: RetryBudget | None = DEFAULT_RETRY_BUDGET, **kwargs) -> dict[str, str]:
+	request_headers, request_body = _prepare_request(body, access_token, use_json, headers)
+
+	# A copy, since the caller's may be configuring other requests running at the same time.
+	retry = ExponentialBackoff() if retry is None else retry.copy()
+
+	# The deadline covers every attempt, and the waits between them. Retries also draw on the process-wide budget.
+	retry.start(retry_budget)
+	timeout = kwargs.pop('timeout', None) or request._DEFAULT_TIMEOUT
+
+
+	async def _perform_request () -> tuple[bool, str | bytes | dict, bool | None]:
+		started = instrumentation.start()
+		response = await request(method = 'POST', url = token_uri, headers = request_headers, body = request_body, timeout = retry.clamp_timeout(timeout), **kwargs)
+		instrumentation.stop('http', started)
+
+		if response.status_code != 200 and (delay := _retry_after(response)) is not None:
+			retry.defer(delay)
+
+		return _parse_response(response)
+
+
+	request_succeeded: bool
+	response_data: dict[str, str] | str
+	retryable_error: bool | None
+
+	# Attempt the request
+	request_succeeded, response_data, retryable_error = await _perform_request()
+
+	if request_succeeded:
+		return response_data
+
+	# Fail fast
+	if not can_retry or not retryable_error:
+		_handle_error_response(response_data, retryable_error)
+		return response_data
+
+	# Keep trying, yielding to the event loop between attempts
+	async for _ in retry:
+		instrumentation.increment('token_request.retry')
+		request_succeeded, response_data, retryable_error = await _perform_request()
+
+		if request_succeeded:
+			return response_data
+
+		if not retryable_error:
+			_handle_error_response(response_data, retryable_error)
+			return response_data
+
+	if retry.budget_exhausted:
+		_handle_exhausted_retry_budget(response_data)
+
+	_handle_error_response(response_data, retryable_error)
+	return response_data
+
+
+
+async def jwt_grant (request: AsyncBaseRequest, token_uri: str, assertion: bytes, can_retry: bool = True, retry: ExponentialBackoff | None = None) -> tuple[str, datetime, dict[str, str]]:
+	"""Exchanges a signed assertion for an access token. Pass ``retry`` to change how, and for how long, it retries.
+
+	``retry`` only provides the settings. Each request retries with its own copy, so one instance can be shared.
+	"""
+
+	body, headers = _jwt_grant_request(assertion)
+
+	started = instrumentation.start()
+	try:
+		response_data: dict[str, str] = await _token_endpoint_request(request, token_uri, body, can_retry = can_retry, headers = headers, retry = retry)
+	finally:
+		instrumentation.stop('token_request', started)
+
+	return _parse_jwt_grant_response(response_data)
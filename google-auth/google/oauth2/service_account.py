@@ -12,37 +12,52 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from copy import deepcopy
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from io import open as open_file
-from json import load as load_json
 
 from google.auth.util.helpers import utcnow
-from google.auth.exceptions import MalformedError
-from google.auth.crypt.rsa import RSASigner
-from google.auth.jwt import encode as encode_jwt
+from google.auth.exceptions import MalformedError, RefreshError
+from google.auth.crypt.factory import signer_from_service_account_info
 
 from google.auth.credentials.base import BaseCredentials
+from google.auth.credentials.cache import TokenCache
 from google.auth.crypt.base import BaseSigner
+from google.auth.transport.base import BaseRequest, AsyncBaseRequest
+
+# JSON, JWT and key file handling are imported on first use.
 
 
 
 class Credentials(BaseCredentials):
 	"""Service account credentials"""
 
+	__slots__ = ('_service_account_email', '_subject', '_project_id', '_additional_claims', '_trust_boundary', '_assertion_template', '_always_use_jwt_access', '_default_audience', '_self_signed_jwts')
+
 	GOOGLE_OAUTH2_TOKEN_ENDPOINT: str = 'https://oauth2.googleapis.com/token'
 	DEFAULT_TOKEN_LIFETIME: timedelta = timedelta(hours = 1)
 	DEFAULT_ADDITIONAL_CLAIMS: dict[str, str] = {}
 	DEFAULT_TRUST_BOUNDARY: dict[str, list | str] = {'locations': [], 'encoded_locations': '0x0'}
 
+	# How many self-signed JWTs are kept, one per audience or scope set.
+	SELF_SIGNED_JWT_CACHE_SIZE: int = 8
+
 	_service_account_email: str
 	_subject: str | None
 	_project_id: str | None
 	_additional_claims: dict[str, str]
 	_trust_boundary: dict[str, list | str]
 
+	# Built on first use, since the claims never change.
+	_assertion_template: 'JWTTemplate | None'
+
+	# Self-signed JWTs are used as access tokens in place of a token endpoint round-trip.
+	_always_use_jwt_access: bool
+	_default_audience: str | None
+	# Created on first use.
+	_self_signed_jwts: TokenCache | None
+
 
-	def __init__ (self, *, service_account_email: str, subject: str | None = None, project_id: str | None = None, additional_claims: dict[str, str] | None = None, trust_boundary: dict[str, list | str] | None = None, **kwargs):
+	def __init__ (self, *, service_account_email: str, subject: str | None = None, project_id: str | None = None, additional_claims: dict[str, str] | None = None, trust_boundary: dict[str, list | str] | None = None, always_use_jwt_access: bool = False, default_audience: str | None = None, **kwargs):
 		super().__init__(**kwargs)
 
 		self._service_account_email = service_account_email
@@ -50,13 +65,21 @@ class Credentials(BaseCredentials):
 		self._project_id = project_id
 
 		if additional_claims is None:
-			additional_claims = deepcopy(self.DEFAULT_ADDITIONAL_CLAIMS)
+			additional_claims = dict(self.DEFAULT_ADDITIONAL_CLAIMS)
 		self._additional_claims = additional_claims
 
 		if trust_boundary is None:
 			trust_boundary = self.DEFAULT_TRUST_BOUNDARY
 		self._trust_boundary = trust_boundary
 
+		self._assertion_template = None
+
+		self._always_use_jwt_access = always_use_jwt_access
+		self._default_audience = default_audience
+		self._self_signed_jwts = None
+
+		self._restore_stored_token()
+
 
 	@classmethod
 	def from_service_account_info (cls, info: dict[str, str], **kwargs) -> 'Credentials':
@@ -65,8 +88,14 @@ class Credentials(BaseCredentials):
 		if missing_fields := {'client_email', 'token_uri'}.difference(info.keys()):
 			raise MalformedError(f"Service account info was not in the expected format, missing fields {", ".join(missing_fields)}.")
 
-		params: dict[str, BaseSigner | str] = deepcopy(kwargs)
-		params.update({'signer': RSASigner.from_service_account_info(info), 'service_account_email': info['client_email'], 'token_uri': info['token_uri'], 'project_id': info.get('project_id'), 'trust_boundary': info.get('trust_boundary')})
+		params: dict[str, BaseSigner | str] = dict(kwargs)
+
+		# Copied, so later changes to the caller's lists and dicts can't alter the cache key or assertion claims.
+		for name, copy in (('scopes', list), ('default_scopes', list), ('additional_claims', dict)):
+			if params.get(name) is not None:
+				params[name] = copy(params[name])
+
+		params.update({'signer': signer_from_service_account_info(info), 'service_account_email': info['client_email'], 'token_uri': info['token_uri'], 'project_id': info.get('project_id'), 'trust_boundary': info.get('trust_boundary')})
 
 		return cls(**params)
 
@@ -75,12 +104,83 @@ class Credentials(BaseCredentials):
 	def from_service_account_file (cls, filename: str, **kwargs) -> 'Credentials':
 		"""Creates a Credentials instance from a service account JSON file."""
 
+		from json import load as load_json
+
 		with open_file(filename, 'r', encoding = 'utf-8') as json_file:
 			info: dict['str', 'str'] = load_json(json_file)
 
 		return cls.from_service_account_info(info = info, **kwargs)
 
 
+	@classmethod
+	def from_service_account_binary_file (cls, filename: str, **kwargs) -> 'Credentials':
+		"""Creates a Credentials instance from a key file converted by ``google.oauth2.service_account_binary``."""
+
+		from google.oauth2.service_account_binary import load as load_binary_key_file
+
+		return cls.from_service_account_info(info = load_binary_key_file(filename), **kwargs)
+
+
+	def _derive (self, **overrides) -> 'Credentials':
+		"""Copies these credentials, sharing the signer and its key, but with a token of their own.
+
+		The token store is only shared when the copy has the same cache key, since a store holds a single token.
+		"""
+
+		params: dict = {
+			'service_account_email': self._service_account_email,
+			'subject': self._subject,
+			'project_id': self._project_id,
+			'additional_claims': dict(self._additional_claims),
+			'trust_boundary': self._trust_boundary,
+			'always_use_jwt_access': self._always_use_jwt_access,
+			'default_audience': self._default_audience,
+			'token_uri': self._token_uri,
+			'scopes': self._scopes,
+			'default_scopes': self._default_scopes,
+			'signer': self._signer,
+			'token_cache': self._token_cache,
+			'token_store': None,
+			'non_blocking_refresh': self._refresh_worker is not None,
+		}
+		params.update(overrides)
+
+		derived = type(self)(**params)
+
+		if 'token_store' not in overrides and self._token_store is not None and (key := derived._cache_key) is not None and key == self._cache_key:
+			derived._token_store = self._token_store
+			derived._restore_stored_token()
+
+		return derived
+
+
+	def with_subject (self, subject: str) -> 'Credentials':
+		"""Returns credentials that impersonate ``subject`` through domain-wide delegation."""
+
+		return self._derive(subject = subject)
+
+
+	def with_scopes (self, scopes: list[str], default_scopes: list[str] | None = None) -> 'Credentials':
+		"""Returns credentials with different scopes."""
+
+		return self._derive(scopes = list(scopes), default_scopes = self._default_scopes if default_scopes is None else list(default_scopes))
+
+
+	def with_signer (self, signer: BaseSigner) -> 'Credentials':
+		"""Returns credentials that sign their assertions with ``signer``, which must hold the same key."""
+
+		return self._derive(signer = signer)
+
+
+	def with_claims (self, additional_claims: dict[str, str]) -> 'Credentials':
+		"""Returns credentials whose assertions carry ``additional_claims`` as well as these credentials' own."""
+
+		claims = dict(self._additional_claims)
+		claims.update(additional_claims)
+
+		return self._derive(additional_claims = claims)
+
+
 	@property
 	def service_account_email (self) -> str:
 		"""The service account email."""
@@ -102,27 +202,103 @@ class Credentials(BaseCredentials):
 		return not self._scopes
 
 
-	def _make_authorization_grant_assertion (self) -> bytes:
-		"""Creates an OAuth 2.0 assertion."""
+	@property
+	def _cache_key (self) -> tuple | None:
+		# Additional claims can change what the token grants, so only plain credentials share tokens.
+		if self._additional_claims:
+			return None
+
+		return self._service_account_email, tuple(sorted(self._scopes)), self._subject, self._token_uri
+
 
-		now: datetime = utcnow()
-		expiry: datetime = now + self.DEFAULT_TOKEN_LIFETIME
+	def _make_assertion_template (self) -> 'JWTTemplate':
+		from google.auth.jwt import JWTTemplate
 
-		payload: dict = {
-			'iat': int(now.timestamp()),
-			'exp': int(expiry.timestamp()),  # The issuer must be the service account email.
-			'iss': self._service_account_email,  # The audience must be the auth token endpoint's URI
-			'aud': self.GOOGLE_OAUTH2_TOKEN_ENDPOINT,
+		claims: dict = {
+			'iss': self._service_account_email,  # The issuer must be the service account email.
+			'aud': self.GOOGLE_OAUTH2_TOKEN_ENDPOINT,  # The audience must be the auth token endpoint's URI
 			'scope': ' '.join(self._scopes)
 		}
 
-		payload.update(self._additional_claims)
+		claims.update(self._additional_claims)
 
 		# The subject can be a user email for domain-wide delegation.
 		if self._subject:
-			payload.setdefault('sub', self._subject)
+			claims.setdefault('sub', self._subject)
+
+		return JWTTemplate(self._signer, claims)
+
+
+	def _make_authorization_grant_assertion (self) -> bytes:
+		"""Creates an OAuth 2.0 assertion."""
+
+		if self._assertion_template is None:
+			self._assertion_template = self._make_assertion_template()
+
+		issued_at = int(utcnow().timestamp())
+
+		return self._assertion_template.encode(issued_at, issued_at + int(self.DEFAULT_TOKEN_LIFETIME.total_seconds()))
+
+
+	@property
+	def _use_self_signed_jwt (self) -> bool:
+		# Domain-wide delegation needs the token endpoint.
+		return self._always_use_jwt_access and not self._subject
+
+
+	def self_signed_jwt (self, audience: str | None = None) -> tuple[str, datetime]:
+		"""Returns a JWT, signed by the service account, that Google APIs accept as an access token.
+
+		The token is for ``audience`` (an API's URL, such as ``https://pubsub.googleapis.com/``) when one is given,
+		and for the credentials' scopes otherwise. Tokens are cached and only signed again once they go stale, so
+		no network I/O is ever needed.
+		"""
+
+		scope = ' '.join(self._scopes)
+		if not audience and not scope:
+			raise RefreshError("Self-signed JWTs need an audience or scopes.", retryable = False)
+
+		key = (audience, scope)
+
+		if self._self_signed_jwts is None:
+			self._self_signed_jwts = TokenCache(self.SELF_SIGNED_JWT_CACHE_SIZE)
+
+		if (entry := self._self_signed_jwts.get(key)) is not None and utcnow() < entry[1] - self.REFRESH_THRESHOLD:
+			return entry
+
+		claims: dict = {'iss': self._service_account_email, 'sub': self._service_account_email}
+
+		if audience:
+			claims['aud'] = audience
+		else:
+			claims['scope'] = scope
+
+		claims.update(self._additional_claims)
+
+		issued_at = int(utcnow().timestamp())
+		expiry = issued_at + int(self.DEFAULT_TOKEN_LIFETIME.total_seconds())
+
+		from google.auth.jwt import JWTTemplate
+
+		token = JWTTemplate(self._signer, claims).encode(issued_at, expiry).decode('utf-8')
+		entry = token, datetime.fromtimestamp(expiry, timezone.utc)
+
+		self._self_signed_jwts.set(key, *entry)
+		return entry
+
+
+	def refresh (self, request: BaseRequest, retry: 'ExponentialBackoff | None' = None):
+		if not self._use_self_signed_jwt:
+			return super().refresh(request, retry)
+
+		self.token, self.expiry = self.self_signed_jwt(self._default_audience)
+
+
+	async def refresh_async (self, request: AsyncBaseRequest, retry: 'ExponentialBackoff | None' = None):
+		if not self._use_self_signed_jwt:
+			return await super().refresh_async(request, retry)
 
-		return encode_jwt(self._signer, payload)
+		self.token, self.expiry = self.self_signed_jwt(self._default_audience)
 
 
 	@property
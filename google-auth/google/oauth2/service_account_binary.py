@@ -0,0 +1,175 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A compact binary service account key file, quicker to load than JSON on small devices.
+
+Convert a key on a workstation, from either Google's JSON key or the component JSON::
+
+	python -m google.oauth2.service_account_binary service_account.json service_account.bin
+
+The layout, with every integer big-endian:
+
+* the magic bytes ``GSA\\x01``
+* the modulus and prime widths in bytes (two u16) and the public exponent (u32)
+* ``n`` and ``d``, at the modulus width, then ``p``, ``q``, ``dp``, ``dq`` and ``qinv``, at the prime width
+* the private key ID, client email, token URI and project ID as u16 length prefixed UTF-8, empty when absent
+"""
+
+from json import load as load_json
+from struct import pack, unpack_from, calcsize
+import sys
+
+from google.auth.crypt.der import pem_to_der, parse_rsa_private_key
+from google.auth.crypt.rsa import RSAPrivateKey, RSASigner, _byte_length
+from google.auth.exceptions import MalformedError
+
+
+MAGIC: bytes = b'GSA\x01'
+
+_HEADER_FORMAT: str = '>4sHHI'
+_HEADER_SIZE: int = calcsize(_HEADER_FORMAT)
+
+_MODULUS_COMPONENTS: tuple[str, ...] = ('n', 'd')
+_PRIME_COMPONENTS: tuple[str, ...] = ('p', 'q', 'dp', 'dq', 'qinv')
+
+_METADATA_FIELDS: tuple[str, ...] = (RSASigner.SERVICE_ACCOUNT_INFO_PRIVATE_KEY_ID, 'client_email', 'token_uri', 'project_id')
+
+
+
+def _private_key_components (info: dict) -> dict[str, int]:
+	if (components := info.get(RSASigner.SERVICE_ACCOUNT_INFO_PRIVATE_KEY)) is None:
+		if (pem := info.get('private_key')) is None:
+			raise MalformedError("Service account info has neither private_key nor private_key_components.")
+
+		components = parse_rsa_private_key(pem_to_der(pem))
+
+	if missing_components := RSASigner.PRIVATE_KEY_COMPONENTS.difference(components.keys()):
+		raise MalformedError(f"Private key is missing components {', '.join(missing_components)}.")
+
+	# Fills in any of the CRT parameters the source didn't have.
+	key = RSAPrivateKey(n = components['n'], e = components['e'], d = components['d'], p = components['p'], q = components['q'], dp = components.get('dp'), dq = components.get('dq'), qinv = components.get('qinv'))
+
+	if key.p * key.q != key.n:
+		raise MalformedError("The private key's primes don't match its modulus.")
+
+	return {'n': key.n, 'e': key.e, 'd': key.d, 'p': key.p, 'q': key.q, 'dp': key.dp, 'dq': key.dq, 'qinv': key.qinv}
+
+
+
+def encode (info: dict) -> bytes:
+	"""Converts parsed service account info, in either JSON format, into the binary format."""
+
+	components = _private_key_components(info)
+
+	if components['e'] >= 1 << 32:
+		raise MalformedError("The public exponent is too large.")
+
+	modulus_length = _byte_length(components['n'])
+	prime_length = max(_byte_length(components[name]) for name in _PRIME_COMPONENTS)
+
+	parts: list[bytes] = [pack(_HEADER_FORMAT, MAGIC, modulus_length, prime_length, components['e'])]
+	parts.extend(components[name].to_bytes(modulus_length, 'big') for name in _MODULUS_COMPONENTS)
+	parts.extend(components[name].to_bytes(prime_length, 'big') for name in _PRIME_COMPONENTS)
+
+	for field in _METADATA_FIELDS:
+		value = (info.get(field) or '').encode('utf-8')
+		parts.append(pack('>H', len(value)))
+		parts.append(value)
+
+	return b''.join(parts)
+
+
+
+def decode (data) -> dict:
+	"""Reads the binary format into service account info, with precomputed key components.
+
+	``data`` can be anything that slices into bytes, such as a ``memoryview`` or an ``mmap``. Empty metadata fields are
+	left out, so the info is checked for them just as JSON info would be.
+	"""
+
+	if len(data) < _HEADER_SIZE:
+		raise MalformedError("The service account key file is truncated.")
+
+	magic, modulus_length, prime_length, e = unpack_from(_HEADER_FORMAT, data)
+	if magic != MAGIC:
+		raise MalformedError("Not a binary service account key file.")
+
+	offset = _HEADER_SIZE
+
+	if offset + len(_MODULUS_COMPONENTS) * modulus_length + len(_PRIME_COMPONENTS) * prime_length > len(data):
+		raise MalformedError("The service account key file is truncated.")
+
+	components: dict[str, int] = {'e': e}
+
+	for names, length in ((_MODULUS_COMPONENTS, modulus_length), (_PRIME_COMPONENTS, prime_length)):
+		for name in names:
+			components[name] = int.from_bytes(data[offset:offset + length], 'big')
+			offset += length
+
+	info: dict = {RSASigner.SERVICE_ACCOUNT_INFO_PRIVATE_KEY: components}
+
+	for field in _METADATA_FIELDS:
+		if offset + 2 > len(data):
+			raise MalformedError("The service account key file is truncated.")
+
+		length = unpack_from('>H', data, offset)[0]
+		offset += 2
+
+		if offset + length > len(data):
+			raise MalformedError("The service account key file is truncated.")
+
+		if length:
+			try:
+				info[field] = bytes(data[offset:offset + length]).decode('utf-8')
+
+			except UnicodeError:
+				raise MalformedError(f"The service account key file's {field} is not UTF-8.")
+
+			offset += length
+
+	return info
+
+
+
+def load (filename: str) -> dict:
+	"""Reads a binary service account key file, mapping it into memory where the platform can."""
+
+	with open(filename, 'rb') as key_file:
+		try:
+			from mmap import mmap, ACCESS_READ
+
+		except ImportError:
+			# MicroPython. Slicing a memoryview doesn't copy.
+			return decode(memoryview(key_file.read()))
+
+		with mmap(key_file.fileno(), 0, access = ACCESS_READ) as mapped:
+			return decode(mapped)
+
+
+
+def convert (json_filename: str, binary_filename: str) -> None:
+	"""Converts a service account JSON key file into the binary format."""
+
+	with open(json_filename, 'r', encoding = 'utf-8') as json_file:
+		info = load_json(json_file)
+
+	data = encode(info)
+
+	with open(binary_filename, 'wb') as binary_file:
+		binary_file.write(data)
+
+
+
+if __name__ == '__main__':
+	convert(*sys.argv[1:3])
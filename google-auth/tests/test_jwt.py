@@ -0,0 +1,71 @@
+# Copyright 2026 Rob Speed
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run from the ``google-auth`` directory with ``python -m pytest tests``."""
+
+import sys
+
+from google.auth import jwt
+from google.auth.crypt.base import BaseSigner
+
+
+CLAIMS: dict[str, str] = {'iss': 'test@example.com', 'scope': 'https://www.googleapis.com/auth/cloud-platform'}
+
+# Longer than any scratch buffer left over by earlier tokens, so encoding has to grow it.
+LONG_CLAIMS: dict[str, str] = {'iss': 'test@example.com', 'scope': 'x' * 4096}
+
+
+
+class _FlakySigner(BaseSigner):
+	"""Raises on its first signature, then signs with a fixed value."""
+
+	__slots__ = ('_calls',)
+
+
+	def __init__ (self):
+		self._calls = 0
+
+
+	@property
+	def key_id (self) -> str:
+		return 'flaky'
+
+
+	def sign (self, message: bytes) -> bytes:
+		self._calls += 1
+
+		if self._calls == 1:
+			raise ValueError("First signature fails.")
+
+		return bytes(256)
+
+
+
+def test_template_recovers_from_a_failed_signature ():
+	signer = _FlakySigner()
+	template = jwt.JWTTemplate(signer, CLAIMS)
+
+	try:
+		template.encode(0, 3600)
+
+	except ValueError:
+		# Kept, as a caller logging or re-raising it later would, along with its traceback.
+		error = sys.exc_info()
+
+	assert error[0] is ValueError
+
+	# Growing the shared scratch buffer fails while anything still holds a view of it.
+	token = jwt.JWTTemplate(signer, LONG_CLAIMS).encode(0, 3600)
+
+	assert token == jwt.encode(signer, {'iat': 0, 'exp': 3600, **LONG_CLAIMS})